@@ -5,25 +5,40 @@ This package provides tools for programmatically controlling DaVinci Resolve,
 with integration for Google's Gemini AI for intelligent video editing assistance.
 """
 
+import importlib
+from importlib.util import find_spec
+
 # Version information
 __version__ = "0.1.0"
 
-# Import main components for easy access
-from davincimcp.core.resolve_controller import ResolveController
-from davincimcp.core.gemini_handler import GeminiAPIHandler
-from davincimcp.core.media.media_control_handler import MediaControlHandler
-from davincimcp.core.mcp.mcp_handler import MCPHandler
-from davincimcp.core.mcp.mcp_client import MCPClient
-from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor, Command
-from davincimcp.media.analyzer import MediaAnalyzer, EditSuggestionEngine
-from davincimcp.utils.config import Config
-
-# UI components
-try:
-    from davincimcp.ui import MainWindow, run_app
-    __has_ui__ = True
-except ImportError:
-    __has_ui__ = False
+# Main components, imported lazily on first attribute access (PEP 562) so that
+# importing the package does not pull in Gemini, MCP or Qt dependencies
+_LAZY_IMPORTS = {
+    'ResolveController': 'davincimcp.core.resolve_controller',
+    'GeminiAPIHandler': 'davincimcp.core.gemini_handler',
+    'MediaControlHandler': 'davincimcp.core.media.media_control_handler',
+    'MCPHandler': 'davincimcp.core.mcp.mcp_handler',
+    'MCPClient': 'davincimcp.core.mcp.mcp_client',
+    'CommandRegistry': 'davincimcp.commands.command_registry',
+    'CommandExecutor': 'davincimcp.commands.command_registry',
+    'Command': 'davincimcp.commands.command_base',
+    'MediaAnalyzer': 'davincimcp.media.analyzer',
+    'EditSuggestionEngine': 'davincimcp.media.analyzer',
+    'Config': 'davincimcp.utils.config',
+    'MainWindow': 'davincimcp.ui',
+    'run_app': 'davincimcp.ui',
+}
+
+# UI components are available when PySide6 is installed
+__has_ui__ = find_spec('PySide6') is not None
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'ResolveController',
@@ -43,4 +58,4 @@ __all__ = [
 
 # Add UI components to __all__ if available
 if __has_ui__:
-    __all__ += ['MainWindow', 'run_app'] 
\ No newline at end of file
+    __all__ += ['MainWindow', 'run_app']
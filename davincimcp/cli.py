@@ -7,129 +7,228 @@ It parses command line arguments and dispatches to the appropriate handler.
 """
 
 import sys
+import signal
 import logging
 import argparse
 import asyncio
+import functools
 from typing import Optional, List
 
-from davincimcp.core.resolve_controller import ResolveController
-from davincimcp.core.gemini_handler import GeminiAPIHandler
-from davincimcp.core.mcp.mcp_handler import MCPHandler
-from davincimcp.core.mcp.mcp_client import MCPClient
-from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor
-from davincimcp.media.analyzer import MediaAnalyzer, EditSuggestionEngine
 from davincimcp.utils.config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Heavier components (Resolve, Gemini, MCP, analysis) are imported inside the
+# handlers that use them so each subcommand only loads what it needs
+
+# Logging is configured in main() once the subcommand is known; until then
+# warnings and errors still reach stderr through logging's last-resort handler
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+# Log level names accepted by --log-level, mapped to their numeric levels
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+def _log_level(name: str) -> int:
     """
-    Parse command line arguments
+    Convert a --log-level value to its numeric logging level
     
     Args:
-        args (Optional[List[str]]): Command line arguments (uses sys.argv if None)
+        name (str): Log level name
         
     Returns:
-        argparse.Namespace: Parsed arguments
+        int: Numeric logging level
     """
-    parser = argparse.ArgumentParser(
-        description="DavinciMCP - Python interface for controlling DaVinci Resolve with AI integration"
-    )
+    try:
+        return _LEVELS[name]
+    except KeyError:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: {name!r} (choose from {', '.join(_LEVELS)})"
+        )
+
+# Words that end an interactive session
+_EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+# MediaAnalyzer method run for each analyze target. Names rather than
+# functions keep the analyzer import inside _run_analyze.
+_ANALYZE_METHODS = {
+    "current": "analyze_current_clip",
+    "selected": "analyze_selected_clips",
+    "all": "analyze_all_media",
+}
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that adds a subcommand's arguments on first use
     
-    # Global options
-    parser.add_argument(
-        "--log-level", 
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Set the logging level"
-    )
+    Subcommands are registered with their name and help text only; the
+    arguments of a subcommand are added just before it parses, so a CLI
+    call only pays for the subcommand it actually runs.
+    """
     
-    # Subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._builders = {}
     
-    # Interactive mode (default)
-    interactive_parser = subparsers.add_parser(
-        "interactive", 
-        help="Start interactive mode"
-    )
-    interactive_parser.add_argument(
+    def add_lazy_parser(self, name, builder, **kwargs) -> argparse.ArgumentParser:
+        """
+        Register a subcommand whose arguments are added by builder on first use
+        
+        Args:
+            name (str): Subcommand name
+            builder: Callable that adds arguments to the subcommand parser
+            **kwargs: Keyword arguments for add_parser
+            
+        Returns:
+            argparse.ArgumentParser: The (still empty) subcommand parser
+        """
+        subparser = self.add_parser(name, **kwargs)
+        self._builders[name] = builder
+        return subparser
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        builder = self._builders.pop(values[0], None)
+        if builder is not None:
+            builder(self._name_parser_map[values[0]])
+        super().__call__(parser, namespace, values, option_string)
+
+def _add_interactive_args(parser: argparse.ArgumentParser):
+    """Add arguments for interactive mode"""
+    parser.add_argument(
         "--no-feedback", 
         action="store_true",
         help="Disable operation feedback"
     )
-    interactive_parser.add_argument(
+    parser.add_argument(
         "--use-mcp",
         action="store_true",
         help="Use Model Context Protocol for AI interaction"
     )
-    
-    # MCP mode
-    mcp_parser = subparsers.add_parser(
-        "mcp",
-        help="Start MCP interactive mode with Claude integration"
-    )
-    mcp_parser.add_argument(
+
+def _add_mcp_args(parser: argparse.ArgumentParser):
+    """Add arguments for MCP mode"""
+    parser.add_argument(
         "--server-script",
         type=str,
         help="Path to MCP server script"
     )
-    
-    # GUI mode
-    gui_parser = subparsers.add_parser(
-        "gui", 
-        help="Start GUI mode"
-    )
-    
-    # Single command mode
-    cmd_parser = subparsers.add_parser(
-        "cmd", 
-        help="Execute a single command"
-    )
-    cmd_parser.add_argument(
+
+def _add_cmd_args(parser: argparse.ArgumentParser):
+    """Add arguments for single command mode"""
+    parser.add_argument(
         "text", 
         type=str,
         help="Command text to execute"
     )
-    cmd_parser.add_argument(
+    parser.add_argument(
         "--no-feedback", 
         action="store_true",
         help="Disable operation feedback"
     )
-    
-    # Media analysis mode
-    analyze_parser = subparsers.add_parser(
-        "analyze", 
-        help="Analyze media and suggest edits"
-    )
-    analyze_parser.add_argument(
+
+def _add_analyze_args(parser: argparse.ArgumentParser):
+    """Add arguments for media analysis mode"""
+    parser.add_argument(
         "--target", 
-        choices=["current", "selected", "all"],
+        choices=list(_ANALYZE_METHODS),
         default="current",
         help="Which media to analyze"
     )
-    analyze_parser.add_argument(
+    parser.add_argument(
         "--output", 
         choices=["console", "file"],
         default="console",
         help="Where to output results"
     )
-    analyze_parser.add_argument(
+    parser.add_argument(
         "--output-file", 
         type=str,
         help="File to write results to (if output=file)"
     )
+
+def _add_no_args(parser: argparse.ArgumentParser):
+    """Subcommands without arguments"""
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line argument parser
+    
+    The parser is built once and reused by later parse_args calls.
+    Subcommand arguments are added lazily by _LazySubParsersAction.
+    
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="DavinciMCP - Python interface for controlling DaVinci Resolve with AI integration"
+    )
+    parser.register("action", "parsers", _LazySubParsersAction)
+    
+    # Global options
+    parser.add_argument(
+        "--log-level", 
+        type=_log_level,
+        metavar="{" + ",".join(_LEVELS) + "}",
+        help="Set the logging level"
+    )
+    
+    # Subcommand options read by handlers that serve several subcommands
+    parser.set_defaults(no_feedback=False, use_mcp=False, server_script=None)
+    
+    # Subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    
+    # Interactive mode (default)
+    subparsers.add_lazy_parser(
+        "interactive", _add_interactive_args,
+        help="Start interactive mode"
+    )
+    
+    # MCP mode
+    subparsers.add_lazy_parser(
+        "mcp", _add_mcp_args,
+        help="Start MCP interactive mode with Claude integration"
+    )
+    
+    # GUI mode
+    subparsers.add_lazy_parser(
+        "gui", _add_no_args,
+        help="Start GUI mode"
+    )
+    
+    # Single command mode
+    subparsers.add_lazy_parser(
+        "cmd", _add_cmd_args,
+        help="Execute a single command"
+    )
+    
+    # Media analysis mode
+    subparsers.add_lazy_parser(
+        "analyze", _add_analyze_args,
+        help="Analyze media and suggest edits"
+    )
     
     # Server mode
-    server_parser = subparsers.add_parser(
-        "server",
+    subparsers.add_lazy_parser(
+        "server", _add_no_args,
         help="Start MCP server"
     )
     
-    return parser.parse_args(args)
+    return parser
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
+    
+    Args:
+        args (Optional[List[str]]): Command line arguments (uses sys.argv if None)
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    return _build_parser().parse_args(args)
 
 async def run_mcp_mode(config: Config, server_script: Optional[str] = None) -> int:
     """
@@ -147,6 +246,9 @@ async def run_mcp_mode(config: Config, server_script: Optional[str] = None) -> i
         logger.error("Anthropic API key not found. Set ANTHROPIC_API_KEY in your .env file.")
         return 1
     
+    from davincimcp.core.resolve_controller import ResolveController
+    from davincimcp.core.mcp.mcp_client import MCPClient
+    
     # Initialize Resolve controller
     controller = ResolveController()
     
@@ -167,7 +269,7 @@ async def run_mcp_mode(config: Config, server_script: Optional[str] = None) -> i
         return 1
     
     # Connect to MCP server
-    logger.info(f"Connecting to MCP server: {server_script}")
+    logger.info("Connecting to MCP server: %s", server_script)
     connected = await client.connect_to_server(server_script)
     
     if not connected:
@@ -176,37 +278,37 @@ async def run_mcp_mode(config: Config, server_script: Optional[str] = None) -> i
     
     try:
         # Run interactive session
-        print("\n===== DaVinci Resolve MCP Interactive Session =====")
-        print("Type 'exit' or 'quit' to end the session.")
-        print("Example commands:")
-        print("- Tell me about my current project")
-        print("- Cut the clip at the current position")
-        print("- Add a cross dissolve transition that's 1.5 seconds")
-        print("=====================================================\n")
+        sys.stdout.write(
+            "\n===== DaVinci Resolve MCP Interactive Session =====\n"
+            "Type 'exit' or 'quit' to end the session.\n"
+            "Example commands:\n"
+            "- Tell me about my current project\n"
+            "- Cut the clip at the current position\n"
+            "- Add a cross dissolve transition that's 1.5 seconds\n"
+            "=====================================================\n\n"
+        )
         
-        while True:
+        from davincimcp.interactive.prompt import read_commands
+        
+        for user_input in read_commands("\nEnter a command (or 'exit' to quit): "):
+            # Check for exit command
+            if user_input.lower() in _EXIT_COMMANDS:
+                print("Exiting session...")
+                break
+            
             try:
-                # Get user input
-                user_input = input("\nEnter a command (or 'exit' to quit): ").strip()
-                
-                # Check for exit command
-                if user_input.lower() in ['exit', 'quit']:
-                    print("Exiting session...")
-                    break
-                    
                 # Process query with MCP
                 print("Processing...")
                 response = await client.process_query(user_input)
                 
                 # Display response
-                print("\nResponse:")
-                print(response)
+                sys.stdout.write(f"\nResponse:\n{response}\n")
                 
             except KeyboardInterrupt:
                 print("\nSession interrupted. Exiting...")
                 break
             except Exception as e:
-                logger.error(f"Error during interactive session: {str(e)}")
+                logger.error("Error during interactive session: %s", e)
                 print(f"\nError: {str(e)}")
                 
         return 0
@@ -225,6 +327,8 @@ async def run_server_mode(config: Config) -> int:
     Returns:
         int: Exit code (0 for success, non-zero for errors)
     """
+    from davincimcp.core.mcp.mcp_handler import MCPHandler
+    
     # Initialize MCP handler
     mcp_handler = MCPHandler(config)
     
@@ -236,14 +340,29 @@ async def run_server_mode(config: Config) -> int:
         logger.error("Failed to start MCP server.")
         return 1
     
+    # Wait on an event set by SIGINT/SIGTERM rather than polling
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    handled_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+            handled_signals.append(sig)
+        except (NotImplementedError, RuntimeError):
+            # No loop signal handlers (e.g. on Windows); Ctrl+C still raises KeyboardInterrupt
+            pass
+    
     try:
         # Keep server running until interrupted
         print("MCP server running. Press Ctrl+C to stop.")
-        while True:
-            await asyncio.sleep(1)
+        await stop.wait()
+        print("\nServer interrupted. Shutting down...")
     except KeyboardInterrupt:
         print("\nServer interrupted. Shutting down...")
     finally:
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        
         # Stop server
         await mcp_handler.stop_server()
     
@@ -260,40 +379,18 @@ def run_gui_mode() -> int:
         from davincimcp.ui.app import run_app
         return run_app()
     except ImportError as e:
-        logger.error(f"Failed to import GUI components: {str(e)}")
+        logger.error("Failed to import GUI components: %s", e)
         logger.error("Make sure PySide6 is installed: pip install PySide6")
         return 1
 
-def main(args: Optional[List[str]] = None) -> int:
+def _connect_controller():
     """
-    Main entry point for the application
+    Create a ResolveController and connect it to DaVinci Resolve
     
-    Args:
-        args (Optional[List[str]]): Command line arguments (uses sys.argv if None)
-        
     Returns:
-        int: Exit code (0 for success, non-zero for errors)
+        Optional[ResolveController]: Connected controller, or None on failure
     """
-    parsed_args = parse_args(args)
-    
-    # Set log level if specified
-    if parsed_args.log_level:
-        logging.getLogger().setLevel(getattr(logging, parsed_args.log_level))
-    
-    # Initialize configuration
-    config = Config()
-    
-    # Check for MCP mode
-    if parsed_args.command == "mcp":
-        return asyncio.run(run_mcp_mode(config, parsed_args.server_script if hasattr(parsed_args, 'server_script') else None))
-    
-    # Check for server mode
-    if parsed_args.command == "server":
-        return asyncio.run(run_server_mode(config))
-    
-    # Check for GUI mode first
-    if parsed_args.command == "gui":
-        return run_gui_mode()
+    from davincimcp.core.resolve_controller import ResolveController
     
     # Initialize the Resolve controller
     controller = ResolveController()
@@ -301,78 +398,196 @@ def main(args: Optional[List[str]] = None) -> int:
     # Attempt to connect to Resolve
     if not controller.connect():
         logger.error("Failed to connect to DaVinci Resolve. Is it running?")
-        return 1
+        return None
     
     # Get project info
     project_info = controller.get_project_info()
     if project_info:
-        logger.info(f"Connected to project: {project_info.get('name', 'Unknown')}")
+        logger.info("Connected to project: %s", project_info.get('name', 'Unknown'))
+    
+    return controller
+
+def _run_mcp(parsed_args: argparse.Namespace, config: Config) -> int:
+    """Run the MCP client session"""
+    return asyncio.run(run_mcp_mode(config, parsed_args.server_script))
+
+def _run_server(parsed_args: argparse.Namespace, config: Config) -> int:
+    """Run the MCP server"""
+    return asyncio.run(run_server_mode(config))
+
+def _run_gui(parsed_args: argparse.Namespace, config: Config) -> int:
+    """Run the GUI"""
+    return run_gui_mode()
+
+def _run_interactive(parsed_args: argparse.Namespace, config: Config) -> int:
+    """
+    Run the interactive prompt
+    
+    Args:
+        parsed_args: Parsed command line arguments
+        config: Config instance
+        
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    # Use MCP mode if specified
+    if parsed_args.use_mcp:
+        return asyncio.run(run_mcp_mode(config))
+    
+    controller = _connect_controller()
+    if controller is None:
+        return 1
+    
+    from davincimcp.core.gemini_handler import GeminiAPIHandler
+    from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor
+    from davincimcp.media.analyzer import MediaAnalyzer
+    from davincimcp.interactive.prompt import run_interactive_session
     
     # Initialize handlers
     gemini_handler = GeminiAPIHandler(config.gemini_api_key)
+    command_executor = CommandExecutor(
+        CommandRegistry(controller), 
+        feedback_enabled=not parsed_args.no_feedback,
+        history_max=config.get("history_max", CommandExecutor.HISTORY_MAX)
+    )
+    media_analyzer = MediaAnalyzer(controller)
+    
+    # Run normal interactive mode
+    return run_interactive_session(
+        command_executor, 
+        gemini_handler, 
+        controller, 
+        media_analyzer
+    )
+
+def _run_cmd(parsed_args: argparse.Namespace, config: Config) -> int:
+    """
+    Execute a single command
+    
+    Args:
+        parsed_args: Parsed command line arguments
+        config: Config instance
+        
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    controller = _connect_controller()
+    if controller is None:
+        return 1
+    
+    from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor
     
     # Initialize command system
-    command_registry = CommandRegistry(controller)
     command_executor = CommandExecutor(
-        command_registry, 
-        feedback_enabled=not getattr(parsed_args, 'no_feedback', False)
+        CommandRegistry(controller), 
+        feedback_enabled=not parsed_args.no_feedback
     )
     
+    result = command_executor.execute_from_text(parsed_args.text)
+    status = result.get('status', 'unknown')
+    feedback = result.get('feedback')
+    print(status)
+    if feedback:
+        print(feedback)
+    return 0 if status == 'success' else 1
+
+def _run_analyze(parsed_args: argparse.Namespace, config: Config) -> int:
+    """
+    Analyze media and print or save edit suggestions
+    
+    Args:
+        parsed_args: Parsed command line arguments
+        config: Config instance
+        
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    controller = _connect_controller()
+    if controller is None:
+        return 1
+    
+    from davincimcp.media.analyzer import MediaAnalyzer, EditSuggestionEngine
+    
     # Initialize media analysis components
     media_analyzer = MediaAnalyzer(controller)
     edit_suggestion_engine = EditSuggestionEngine(media_analyzer)
     
-    # Execute the requested command
-    command = parsed_args.command or "interactive"
+    target = parsed_args.target
+    analysis = getattr(media_analyzer, _ANALYZE_METHODS[target])()
     
-    if command == "interactive":
-        # Use MCP mode if specified
-        if getattr(parsed_args, 'use_mcp', False):
-            return asyncio.run(run_mcp_mode(config))
-            
-        # Run normal interactive mode
-        from davincimcp.interactive.prompt import run_interactive_session
-        return run_interactive_session(
-            command_executor, 
-            gemini_handler, 
-            controller, 
-            media_analyzer
-        )
-    elif command == "cmd":
-        result = command_executor.execute_from_text(parsed_args.text)
-        print(result.get('status', 'unknown'))
-        if result.get('feedback'):
-            print(result.get('feedback'))
-        return 0 if result.get('status') == 'success' else 1
-    elif command == "analyze":
-        target = parsed_args.target
-        if target == "current":
-            analysis = media_analyzer.analyze_current_clip()
-        elif target == "selected":
-            analysis = media_analyzer.analyze_selected_clips()
-        else:  # all
-            analysis = media_analyzer.analyze_all_media()
-            
-        suggestions = edit_suggestion_engine.generate_suggestions(analysis)
+    suggestions = edit_suggestion_engine.generate_suggestions(analysis)
+    
+    if parsed_args.output == "console":
+        import io
+        import pprint
         
-        if parsed_args.output == "console":
-            print(f"Analysis results for {target} media:")
-            print(analysis)
-            print("\nEdit suggestions:")
-            print(suggestions)
-        else:  # file
-            output_file = parsed_args.output_file or f"analysis_{target}.txt"
-            with open(output_file, 'w') as f:
-                f.write(f"Analysis results for {target} media:\n")
-                f.write(f"{analysis}\n\n")
-                f.write("Edit suggestions:\n")
-                f.write(f"{suggestions}\n")
-            print(f"Analysis written to {output_file}")
+        # Format the whole report in memory and write it once
+        buf = io.StringIO()
+        buf.write(f"Analysis results for {target} media:\n")
+        pprint.pprint(analysis, stream=buf, width=200, compact=True)
+        buf.write("\nEdit suggestions:\n")
+        pprint.pprint(suggestions, stream=buf, width=200, compact=True)
+        sys.stdout.write(buf.getvalue())
+    else:  # file
+        output_file = parsed_args.output_file or f"analysis_{target}.txt"
+        report = (
+            f"Analysis results for {target} media:\n"
+            f"{analysis}\n\n"
+            "Edit suggestions:\n"
+            f"{suggestions}\n"
+        )
+        with open(output_file, 'w') as f:
+            f.write(report)
+        print(f"Analysis written to {output_file}")
+    
+    return 0
+
+# Subcommand handlers, called with the parsed arguments and the Config
+_DISPATCH = {
+    "interactive": _run_interactive,
+    "mcp": _run_mcp,
+    "server": _run_server,
+    "gui": _run_gui,
+    "cmd": _run_cmd,
+    "analyze": _run_analyze,
+}
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the application
+    
+    Args:
+        args (Optional[List[str]]): Command line arguments (uses sys.argv if None)
         
-        return 0
-    else:
-        logger.error(f"Unknown command: {command}")
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    if args is None:
+        args = sys.argv[1:]
+    
+    # Configure logging first, so every mode (the fast path included) logs
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+    
+    # A bare 'gui' needs neither argument parsing nor configuration
+    if args == ["gui"]:
+        return run_gui_mode()
+    
+    parsed_args = parse_args(args)
+    
+    # Override the log level if specified
+    if parsed_args.log_level is not None:
+        logging.getLogger().setLevel(parsed_args.log_level)
+    
+    # Initialize configuration
+    config = Config()
+    
+    # Execute the requested command
+    command = parsed_args.command or "interactive"
+    handler = _DISPATCH.get(command)
+    if handler is None:
+        logger.error("Unknown command: %s", command)
         return 1
+    return handler(parsed_args, config)
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
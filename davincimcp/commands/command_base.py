@@ -6,16 +6,21 @@ This module provides the base classes for the command pattern implementation.
 """
 
 import logging
-from abc import ABC, abstractmethod
 from typing import Dict, Any
 
 # Logger for this module
 logger = logging.getLogger(__name__)
 
-class Command(ABC):
-    """Abstract base class for all commands"""
+class Command:
+    """
+    Base class for all commands
+    
+    A plain class rather than an ABC so constructing commands does not go
+    through ABCMeta; subclasses must override execute and get_description.
+    """
+    
+    __slots__ = ()
     
-    @abstractmethod
     def execute(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute the command
@@ -26,9 +31,8 @@ class Command(ABC):
         Returns:
             Dict[str, Any]: Result of the command execution
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_description(self) -> str:
         """
         Get a description of the command
@@ -36,7 +40,7 @@ class Command(ABC):
         Returns:
             str: Description of the command
         """
-        pass
+        raise NotImplementedError
     
     def get_feedback(self, result: Dict[str, Any]) -> str:
         """
@@ -46,6 +50,8 @@ class Command(ABC):
             result (Dict[str, Any]): Result of the command execution
             
         Returns:
-            str: Feedback message
+            str: Feedback message, or an empty string for an empty result
         """
+        if not result:
+            return ""
         return f"Command executed with result: {result}" 
\ No newline at end of file
@@ -6,24 +6,147 @@ This module provides the CommandRegistry and CommandExecutor classes
 for registering, looking up, and executing commands.
 """
 
+import functools
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from davincimcp.commands.command_base import Command
 from davincimcp.commands.editing_commands import CutCommand, AddTransitionCommand, SetMarkerCommand
 
+# Optional C-accelerated multi-pattern matcher
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Logger for this module
 logger = logging.getLogger(__name__)
 
+# Transition type keywords, longest first so the most specific name wins
+_TRANSITION_TYPES = (
+    ("cross dissolve", "Cross Dissolve"),
+    ("slide", "Slide"),
+    ("wipe", "Wipe"),
+    ("push", "Push"),
+    ("fade", "Fade"),
+)
+
+# Precompiled parameter extraction patterns
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:s|sec|second)')
+_NAME_RE = re.compile(r'(?:named|called|name)\s+[\'"]?([a-zA-Z0-9 ]+)[\'"]?')
+
+# Marker colors, matched as whole words in a single regex pass
+_MARKER_COLORS = ("blue", "green", "red", "yellow", "purple", "cyan", "magenta", "white", "black")
+_COLOR_RE = re.compile(r'\b(' + '|'.join(_MARKER_COLORS) + r')\b')
+
+# Built matchers shared by registries with identical phrase tables. Command
+# objects are bound to a controller, but the phrase tables are not, so a new
+# registry for a new controller can reuse the matcher built by an earlier one.
+_MATCHER_CACHE: Dict[Tuple, Tuple[List[Tuple[str, str]], Any, Dict[str, Tuple]]] = {}
+
+class _PhraseTrie:
+    """
+    Compressed (Patricia) trie mapping phrases to match payloads
+    
+    Edges are stored as whole label strings keyed by their first character,
+    so phrases sharing a prefix ("cut"/"cut clip") share one path instead of
+    one node per character. iter() mirrors pyahocorasick's Automaton.iter()
+    so either can back CommandRegistry.
+    """
+    
+    __slots__ = ("children", "value")
+    
+    def __init__(self):
+        self.children: Dict[str, Tuple[str, "_PhraseTrie"]] = {}
+        self.value: Any = None
+    
+    def insert(self, phrase: str, value: Any):
+        """
+        Insert a phrase, storing the payload on its terminal node
+        
+        Args:
+            phrase (str): Phrase to insert
+            value (Any): Payload returned when the phrase is found
+        """
+        node = self
+        rest = phrase
+        while rest:
+            entry = node.children.get(rest[0])
+            if entry is None:
+                leaf = _PhraseTrie()
+                leaf.value = value
+                node.children[rest[0]] = (rest, leaf)
+                return
+            
+            label, child = entry
+            common = 0
+            limit = min(len(label), len(rest))
+            while common < limit and label[common] == rest[common]:
+                common += 1
+            
+            if common < len(label):
+                # Split the edge at the end of the shared prefix
+                middle = _PhraseTrie()
+                middle.children[label[common]] = (label[common:], child)
+                node.children[rest[0]] = (label[:common], middle)
+                child = middle
+            
+            node = child
+            rest = rest[common:]
+        
+        node.value = value
+    
+    def iter(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """
+        Find every phrase occurring in the text
+        
+        Args:
+            text (str): Text to search
+            
+        Yields:
+            Tuple[int, Any]: End index of the match and its payload
+        """
+        children = self.children
+        
+        for start in range(len(text)):
+            if text[start] not in children:
+                continue
+            
+            node = self
+            pos = start
+            while pos < len(text):
+                entry = node.children.get(text[pos])
+                if entry is None:
+                    break
+                label, node = entry
+                if not text.startswith(label, pos):
+                    break
+                pos += len(label)
+                if node.value is not None:
+                    yield pos - 1, node.value
+
+
 class CommandRegistry:
     """Registry for all available commands"""
     
+    __slots__ = (
+        "resolve_controller", "commands", "nlp_matchers", "param_matchers",
+        "_phrase_index", "_matcher", "_match_cached", "_exact_matches"
+    )
+    
     def __init__(self, resolve_controller):
         self.resolve_controller = resolve_controller
         self.commands: Dict[str, Command] = {}
         self.nlp_matchers: Dict[str, List[str]] = {}
+        self.param_matchers: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+        self._phrase_index: List[Tuple[str, str]] = []
+        self._matcher = _PhraseTrie()
+        self._match_cached = functools.lru_cache(maxsize=256)(self._match_normalized)
+        self._exact_matches: Dict[str, Tuple[str, Tuple[Tuple[str, Any], ...]]] = {}
         self._register_commands()
+        self._build_matchers()
     
     def _register_commands(self):
         """Register all available commands"""
@@ -42,6 +165,9 @@ class CommandRegistry:
             "add transition", "transition", "dissolve", 
             "cross dissolve", "fade", "wipe"
         ]
+        self.param_matchers["transition"] = {
+            key: ("type", value) for key, value in _TRANSITION_TYPES
+        }
         
         # Register Set Marker command
         marker_cmd = SetMarkerCommand(self.resolve_controller)
@@ -52,6 +178,75 @@ class CommandRegistry:
         
         # Add more commands as needed
     
+    def _build_matchers(self):
+        """
+        Build the phrase matcher used by match_nlp_intent
+        
+        Command phrases and parameter phrases go into one matcher so a single
+        pass over the input yields both the command and keyword parameters.
+        An Aho-Corasick automaton is used when pyahocorasick is installed;
+        otherwise matching falls back to the pure-Python trie.
+        
+        Each payload is a (phrase, command_id, param) tuple, where command_id
+        is None for parameter-only phrases and param is an
+        (owner_command_id, key, value) tuple or None.
+        
+        The built matcher is cached in _MATCHER_CACHE keyed on the phrase
+        tables, so repeated registry construction does not rebuild it.
+        """
+        self._match_cached.cache_clear()
+        
+        cache_key = (
+            tuple((command_id, tuple(phrases))
+                  for command_id, phrases in self.nlp_matchers.items()),
+            tuple((owner_id, tuple(phrase_params.items()))
+                  for owner_id, phrase_params in self.param_matchers.items()),
+            tuple(self.commands),
+            ahocorasick is not None,
+        )
+        cached = _MATCHER_CACHE.get(cache_key)
+        if cached is not None:
+            self._phrase_index, self._matcher, self._exact_matches = cached
+            return
+        
+        # Normalize once, longest phrase first
+        self._phrase_index = sorted(
+            ((phrase.lower().strip(), command_id)
+             for command_id, phrases in self.nlp_matchers.items()
+             for phrase in phrases),
+            key=lambda item: -len(item[0])
+        )
+        
+        payloads: Dict[str, Tuple[str, Optional[str], Optional[Tuple[str, str, Any]]]] = {}
+        for phrase, command_id in self._phrase_index:
+            payloads[phrase] = (phrase, command_id, None)
+        for owner_id, phrase_params in self.param_matchers.items():
+            for phrase, (key, value) in phrase_params.items():
+                phrase = phrase.lower().strip()
+                command_id = payloads[phrase][1] if phrase in payloads else None
+                payloads[phrase] = (phrase, command_id, (owner_id, key, value))
+        
+        if ahocorasick is None:
+            matcher = _PhraseTrie()
+            for phrase, payload in payloads.items():
+                matcher.insert(phrase, payload)
+        else:
+            matcher = ahocorasick.Automaton()
+            for phrase, payload in payloads.items():
+                matcher.add_word(phrase, payload)
+            matcher.make_automaton()
+        self._matcher = matcher
+        
+        # Inputs that are exactly a phrase or command ID skip the scan
+        exact_matches = {}
+        for phrase, _ in self._phrase_index:
+            exact_matches[phrase] = self._match_normalized(phrase)
+        for command_id in self.commands:
+            exact_matches[command_id] = (command_id, ())
+        self._exact_matches = exact_matches
+        
+        _MATCHER_CACHE[cache_key] = (self._phrase_index, matcher, exact_matches)
+    
     def get_command(self, command_id: str) -> Optional[Command]:
         """
         Get a command by its ID
@@ -75,18 +270,100 @@ class CommandRegistry:
             Optional[Dict[str, Any]]: Dictionary with command_id and params if matched
         """
         text = text.lower().strip()
+        match = self._exact_matches.get(text)
+        if match is None:
+            match = self._match_cached(text)
+        if match is None:
+            return None
+        
+        command_id, params = match
+        return {
+            "command_id": command_id,
+            "params": dict(params)
+        }
+    
+    def match_nlp_intent_batch(self, texts: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Match many natural language texts, e.g. lines of a transcript
+        
+        Bulk input is mostly unique lines, so this scans each text directly
+        instead of going through the per-text memo caches, which would only
+        evict the entries serving interactive use.
+        
+        Args:
+            texts (Iterable[str]): Natural language texts
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: match_nlp_intent result per text
+        """
+        exact_get = self._exact_matches.get
+        match_normalized = self._match_normalized
+        results: List[Optional[Dict[str, Any]]] = []
+        append = results.append
+        for text in texts:
+            text = text.lower().strip()
+            match = exact_get(text)
+            if match is None:
+                match = match_normalized(text)
+            if match is None:
+                append(None)
+            else:
+                append({"command_id": match[0], "params": dict(match[1])})
+        return results
+    
+    def _match_normalized(self, text: str) -> Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]]:
+        """
+        Match normalized text, returning a hashable result for caching
+        
+        Args:
+            text (str): Lowercased, stripped natural language text
+            
+        Returns:
+            Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]]: Command
+                identifier and parameter items, or None if nothing matched
+        """
+        command_id, params = self._scan(text)
+        if command_id is None:
+            return None
+        
+        # Extract remaining parameters based on the command
+        params.update(self._extract_params(command_id, text))
+        return command_id, tuple(params.items())
+    
+    def _scan(self, text: str) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Find the command and keyword parameters in a single matcher pass
+        
+        The command is chosen by its longest phrase occurring in the text;
+        keyword parameters owned by that command are likewise resolved by
+        their longest phrase.
+        
+        Args:
+            text (str): Lowercased natural language text
+            
+        Returns:
+            Tuple[Optional[str], Dict[str, Any]]: Command identifier (or None)
+                and the keyword parameters found for it
+        """
+        best_id = None
+        best_len = 0
+        param_hits: Dict[Tuple[str, str], Tuple[int, Any]] = {}
         
-        for command_id, phrases in self.nlp_matchers.items():
-            for phrase in phrases:
-                if phrase in text:
-                    # Extract parameters based on the command
-                    params = self._extract_params(command_id, text)
-                    return {
-                        "command_id": command_id,
-                        "params": params
-                    }
+        for _, (phrase, command_id, param) in self._matcher.iter(text):
+            if command_id is not None and len(phrase) > best_len:
+                best_id, best_len = command_id, len(phrase)
+            if param is not None:
+                owner_id, key, value = param
+                previous = param_hits.get((owner_id, key))
+                if previous is None or len(phrase) > previous[0]:
+                    param_hits[(owner_id, key)] = (len(phrase), value)
         
-        return None
+        params = {
+            key: value
+            for (owner_id, key), (_, value) in param_hits.items()
+            if owner_id == best_id
+        }
+        return best_id, params
     
     def _extract_params(self, command_id: str, text: str) -> Dict[str, Any]:
         """
@@ -102,51 +379,55 @@ class CommandRegistry:
         params = {}
         
         # Different extraction logic based on command type
+        # Keyword parameters such as the transition type come from the
+        # phrase matcher in _scan
         if command_id == "transition":
-            # Extract transition type
-            transition_types = {
-                "cross dissolve": "Cross Dissolve",
-                "fade": "Fade",
-                "wipe": "Wipe",
-                "push": "Push",
-                "slide": "Slide"
-            }
-            
-            for key, value in transition_types.items():
-                if key in text:
-                    params["type"] = value
-                    break
-            
-            # Extract duration
-            duration_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:s|sec|second)', text)
-            if duration_match:
-                params["duration"] = float(duration_match.group(1))
+            # Extract duration (every unit spelling contains an "s")
+            if "s" in text:
+                duration_match = _DURATION_RE.search(text)
+                if duration_match:
+                    params["duration"] = float(duration_match.group(1))
         
         elif command_id == "marker":
             # Extract marker name
-            name_match = re.search(r'(?:named|called|name)\s+[\'"]?([a-zA-Z0-9 ]+)[\'"]?', text)
+            name_match = _NAME_RE.search(text)
             if name_match:
                 params["name"] = name_match.group(1).strip()
             
             # Extract marker color
-            colors = ["blue", "green", "red", "yellow", "purple", "cyan", "magenta", "white", "black"]
-            for color in colors:
-                if color in text:
-                    params["color"] = color.capitalize()
-                    break
+            color_match = _COLOR_RE.search(text)
+            if color_match:
+                params["color"] = color_match.group(1).capitalize()
         
         # Add more parameter extraction for other commands
         
         return params
 
 
+class _HistEntry(NamedTuple):
+    """A single command execution recorded by CommandExecutor"""
+    command_id: Optional[str]
+    params: Dict[str, Any]
+    result: Dict[str, Any]
+    original_text: str
+    feedback: Optional[str] = None
+
+
 class CommandExecutor:
     """Executes commands and manages feedback"""
     
-    def __init__(self, registry: CommandRegistry, feedback_enabled: bool = True):
+    __slots__ = ("registry", "feedback_enabled", "history")
+    
+    # Default maximum number of history entries kept per executor
+    HISTORY_MAX = 1024
+    
+    def __init__(self,
+                 registry: CommandRegistry,
+                 feedback_enabled: bool = True,
+                 history_max: int = HISTORY_MAX):
         self.registry = registry
         self.feedback_enabled = feedback_enabled
-        self.history: List[Dict[str, Any]] = []
+        self.history: Deque[_HistEntry] = deque(maxlen=history_max)
     
     def execute_from_text(self, text: str) -> Dict[str, Any]:
         """
@@ -156,21 +437,45 @@ class CommandExecutor:
             text (str): Natural language command
             
         Returns:
-            Dict[str, Any]: Result of the command execution
+            Dict[str, Any]: Result of the command execution, with status
+                "no_match" if the text did not match any command
         """
         match_result = self.registry.match_nlp_intent(text)
         
         if not match_result:
             result = {
-                "status": "error",
+                "status": "no_match",
                 "message": "Could not understand command",
                 "original_text": text
             }
-            self.history.append(result)
+            self.history.append(_HistEntry(None, {}, result, text))
             return result
         
-        command_id = match_result["command_id"]
-        params = match_result["params"]
+        return self.execute_command(
+            match_result["command_id"],
+            match_result["params"],
+            text
+        )
+    
+    def execute_command(self,
+                        command_id: str,
+                        params: Optional[Dict[str, Any]] = None,
+                        text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute a command by its ID, bypassing natural language matching
+        
+        Args:
+            command_id (str): Command identifier
+            params (Dict[str, Any], optional): Command parameters
+            text (str, optional): Original text, recorded in history
+            
+        Returns:
+            Dict[str, Any]: Result of the command execution
+        """
+        if params is None:
+            params = {}
+        if text is None:
+            text = command_id
         
         command = self.registry.get_command(command_id)
         if not command:
@@ -179,23 +484,19 @@ class CommandExecutor:
                 "message": f"Command '{command_id}' not found",
                 "original_text": text
             }
-            self.history.append(result)
+            self.history.append(_HistEntry(command_id, params, result, text))
             return result
         
         # Execute the command
         result = command.execute(params)
         
         # Add feedback if enabled
+        feedback = None
         if self.feedback_enabled:
-            result["feedback"] = command.get_feedback(result)
+            feedback = result["feedback"] = command.get_feedback(result)
         
         # Add to history
-        self.history.append({
-            "command_id": command_id,
-            "params": params,
-            "result": result,
-            "original_text": text
-        })
+        self.history.append(_HistEntry(command_id, params, result, text, feedback))
         
         return result
     
@@ -209,16 +510,18 @@ class CommandExecutor:
         if not self.history:
             return None
         
-        last_command = self.history[-1]
-        result = last_command.get("result", {})
-        
-        if "feedback" in result:
-            return result["feedback"]
+        last = self.history[-1]
+        if last.feedback is not None:
+            return last.feedback
         
-        command_id = last_command.get("command_id")
-        if command_id:
-            command = self.registry.get_command(command_id)
+        feedback = last.result.get("feedback")
+        if feedback is None and last.command_id:
+            # Feedback was disabled at execution time; build it on demand
+            command = self.registry.get_command(last.command_id)
             if command:
-                return command.get_feedback(result)
+                feedback = command.get_feedback(last.result)
         
-        return None 
\ No newline at end of file
+        # Remember it so repeated calls skip the registry lookup
+        if feedback is not None:
+            self.history[-1] = last._replace(feedback=feedback)
+        return feedback 
\ No newline at end of file
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class CutCommand(Command):
     """Command to cut/split a clip at the current playhead position"""
     
+    __slots__ = ("resolve_controller",)
+    
     def __init__(self, resolve_controller):
         self.resolve_controller = resolve_controller
     
@@ -37,7 +39,7 @@ class CutCommand(Command):
             logger.info("Executing cut command")
             return {"status": "success", "message": "Cut performed at playhead position"}
         except Exception as e:
-            logger.error(f"Error executing cut command: {str(e)}")
+            logger.error("Error executing cut command: %s", e)
             return {"status": "error", "message": str(e)}
     
     def get_description(self) -> str:
@@ -53,6 +55,8 @@ class CutCommand(Command):
 class AddTransitionCommand(Command):
     """Command to add a transition between clips"""
     
+    __slots__ = ("resolve_controller",)
+    
     def __init__(self, resolve_controller):
         self.resolve_controller = resolve_controller
     
@@ -74,7 +78,7 @@ class AddTransitionCommand(Command):
             # success = timeline.AddTransition(transition_type, duration)
             
             # Placeholder for actual implementation
-            logger.info(f"Adding {transition_type} transition with duration {duration}s")
+            logger.info("Adding %s transition with duration %ss", transition_type, duration)
             return {
                 "status": "success", 
                 "message": f"Added {transition_type} transition",
@@ -82,7 +86,7 @@ class AddTransitionCommand(Command):
                 "duration": duration
             }
         except Exception as e:
-            logger.error(f"Error adding transition: {str(e)}")
+            logger.error("Error adding transition: %s", e)
             return {"status": "error", "message": str(e)}
     
     def get_description(self) -> str:
@@ -98,6 +102,8 @@ class AddTransitionCommand(Command):
 class SetMarkerCommand(Command):
     """Command to set a marker at the current playhead position"""
     
+    __slots__ = ("resolve_controller",)
+    
     def __init__(self, resolve_controller):
         self.resolve_controller = resolve_controller
     
@@ -123,7 +129,7 @@ class SetMarkerCommand(Command):
             # success = timeline.AddMarker(current_position, marker_name, marker_color)
             
             # Placeholder for actual implementation
-            logger.info(f"Adding {marker_color} marker '{marker_name}' at current position")
+            logger.info("Adding %s marker '%s' at current position", marker_color, marker_name)
             return {
                 "status": "success", 
                 "message": f"Added marker '{marker_name}'",
@@ -132,7 +138,7 @@ class SetMarkerCommand(Command):
                 "position": current_position
             }
         except Exception as e:
-            logger.error(f"Error adding marker: {str(e)}")
+            logger.error("Error adding marker: %s", e)
             return {"status": "error", "message": str(e)}
     
     def get_description(self) -> str:
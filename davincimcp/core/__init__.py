@@ -2,11 +2,25 @@
 Core module for DaVinci Resolve connection and API handlers.
 """
 
-from davincimcp.core.resolve_controller import ResolveController
-from davincimcp.core.gemini_handler import GeminiAPIHandler
-from davincimcp.core.media.media_control_handler import MediaControlHandler
-from davincimcp.core.mcp.mcp_handler import MCPHandler
-from davincimcp.core.mcp.mcp_client import MCPClient
+import importlib
+
+# Handlers are imported lazily on first attribute access (PEP 562) so that
+# importing one core submodule does not import every handler's dependencies
+_LAZY_IMPORTS = {
+    'ResolveController': 'davincimcp.core.resolve_controller',
+    'GeminiAPIHandler': 'davincimcp.core.gemini_handler',
+    'MediaControlHandler': 'davincimcp.core.media.media_control_handler',
+    'MCPHandler': 'davincimcp.core.mcp.mcp_handler',
+    'MCPClient': 'davincimcp.core.mcp.mcp_client',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'ResolveController',
@@ -14,4 +28,4 @@ __all__ = [
     'MediaControlHandler',
     'MCPHandler',
     'MCPClient'
-] 
\ No newline at end of file
+]
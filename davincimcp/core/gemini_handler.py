@@ -7,8 +7,10 @@ Google's Gemini Generative AI API for intelligent video editing assistance.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
-import google.generativeai as genai
+from typing import Optional, Dict, Any, Iterator, List
+
+# google.generativeai pulls in gRPC, protobuf and Google auth, so it is
+# imported by initialize() only once an API key is actually provided
 
 # Logger for this module
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ class GeminiAPIHandler:
         self.initialized = False
         self.model = None
         self.generation_config = None
+        self._chat_sessions: Dict[str, Any] = {}
         if api_key:
             self.initialize(api_key)
         else:
@@ -40,11 +43,14 @@ class GeminiAPIHandler:
             bool: True if initialization is successful
         """
         try:
+            import google.generativeai as genai
+            
             self.api_key = api_key
             genai.configure(api_key=self.api_key)
             
             # Set default model to Gemini Pro
             self.model = genai.GenerativeModel('gemini-pro')
+            self._chat_sessions.clear()
             
             # Default generation config
             # Temperature values can be updated from config when handler is used
@@ -60,7 +66,7 @@ class GeminiAPIHandler:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize Gemini API: {str(e)}")
+            logger.error("Failed to initialize Gemini API: %s", e)
             self.initialized = False
             return False
     
@@ -79,7 +85,7 @@ class GeminiAPIHandler:
             return "Error: API not initialized"
             
         try:
-            logger.info(f"Processing prompt: {prompt[:50]}...")
+            logger.info("Processing prompt: %.50s...", prompt)
             response = self.model.generate_content(prompt)
             return response.text
         except Exception as e:
@@ -87,6 +93,33 @@ class GeminiAPIHandler:
             logger.error(error_msg)
             return f"Error: {error_msg}"
     
+    def generate_response_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate a response using the Gemini API, yielding text as it arrives
+        
+        Stopping the iteration early abandons the rest of the response, so
+        callers that only need its beginning do not wait for all of it.
+        
+        Args:
+            prompt (str): The input prompt
+            
+        Returns:
+            Iterator[str]: Chunks of the generated response
+        """
+        if not self.initialized:
+            logger.warning("Gemini API not initialized")
+            yield "Error: API not initialized"
+            return
+            
+        try:
+            logger.info("Processing streamed prompt: %.50s...", prompt)
+            for chunk in self.model.generate_content(prompt, stream=True):
+                yield chunk.text
+        except Exception as e:
+            error_msg = f"Error generating response from Gemini API: {str(e)}"
+            logger.error(error_msg)
+            yield f"Error: {error_msg}"
+    
     def generate_with_config(self, 
                            prompt: str, 
                            temperature: Optional[float] = None, 
@@ -107,14 +140,17 @@ class GeminiAPIHandler:
             return "Error: API not initialized"
         
         try:
-            # Create a custom generation config
-            generation_config = self.generation_config.copy()
-            if temperature is not None:
-                generation_config["temperature"] = max(0.0, min(1.0, temperature))
-            if max_output_tokens is not None:
-                generation_config["max_output_tokens"] = max_output_tokens
+            # Create a custom generation config only when something is overridden
+            if temperature is None and max_output_tokens is None:
+                generation_config = self.generation_config
+            else:
+                generation_config = self.generation_config.copy()
+                if temperature is not None:
+                    generation_config["temperature"] = max(0.0, min(1.0, temperature))
+                if max_output_tokens is not None:
+                    generation_config["max_output_tokens"] = max_output_tokens
                 
-            logger.info(f"Processing prompt with custom config: {prompt[:50]}...")
+            logger.info("Processing prompt with custom config: %.50s...", prompt)
             response = self.model.generate_content(
                 prompt,
                 generation_config=generation_config
@@ -126,13 +162,19 @@ class GeminiAPIHandler:
             logger.error(error_msg)
             return f"Error: {error_msg}"
             
-    def chat_session(self, messages: List[Dict[str, str]]) -> str:
+    def chat_session(self, messages: List[Dict[str, str]], session_id: Optional[str] = None) -> str:
         """
         Handle a multi-turn conversation with Gemini
         
+        Without a session_id every user message is sent to a fresh chat. With
+        a session_id the chat is kept between calls: the first call seeds it
+        with the earlier messages as history and later calls send only the
+        newest user message.
+        
         Args:
             messages (List[Dict[str, str]]): List of conversation messages
                 Each message should have 'role' (user/model) and 'content' keys
+            session_id (str, optional): Key of a chat to reuse between calls
                 
         Returns:
             str: The response from Gemini
@@ -142,16 +184,19 @@ class GeminiAPIHandler:
             return "Error: API not initialized"
             
         try:
-            logger.info(f"Processing chat session with {len(messages)} messages")
-            
-            # Convert to the format needed by Gemini API
-            chat = self.model.start_chat(history=[])
+            logger.info("Processing chat session with %d messages", len(messages))
             
-            # Add messages
-            response = None
-            for msg in messages:
-                if msg["role"] == "user":
-                    response = chat.send_message(msg["content"])
+            if session_id is not None:
+                response = self._send_to_session(session_id, messages)
+            else:
+                # Convert to the format needed by Gemini API
+                chat = self.model.start_chat(history=[])
+                
+                # Add messages
+                response = None
+                for msg in messages:
+                    if msg["role"] == "user":
+                        response = chat.send_message(msg["content"])
                     
             if response:
                 return response.text
@@ -161,4 +206,37 @@ class GeminiAPIHandler:
         except Exception as e:
             error_msg = f"Error in chat session: {str(e)}"
             logger.error(error_msg)
-            return f"Error: {error_msg}" 
\ No newline at end of file
+            return f"Error: {error_msg}"
+    
+    def _send_to_session(self, session_id: str, messages: List[Dict[str, str]]) -> Any:
+        """
+        Send the newest user message to a persistent chat
+        
+        Args:
+            session_id (str): Key of the chat in the session cache
+            messages (List[Dict[str, str]]): Conversation messages
+            
+        Returns:
+            Any: Gemini response, or None if the last message is not from the user
+        """
+        if not messages or messages[-1]["role"] != "user":
+            return None
+        
+        chat = self._chat_sessions.get(session_id)
+        if chat is None:
+            history = [
+                {"role": msg["role"], "parts": [msg["content"]]}
+                for msg in messages[:-1]
+            ]
+            chat = self._chat_sessions[session_id] = self.model.start_chat(history=history)
+        
+        return chat.send_message(messages[-1]["content"])
+    
+    def end_chat_session(self, session_id: str):
+        """
+        Discard a persistent chat
+        
+        Args:
+            session_id (str): Key of the chat to discard
+        """
+        self._chat_sessions.pop(session_id, None)
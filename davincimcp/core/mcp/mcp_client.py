@@ -16,6 +16,7 @@ from contextlib import AsyncExitStack
 from davincimcp.utils.config import Config
 from davincimcp.core.resolve_controller import ResolveController
 from davincimcp.utils.exceptions import ConfigError
+from davincimcp.core.mcp.script_type import EXT2TYPE, read_shebang_type
 
 # Logger for this module
 logger = logging.getLogger(__name__)
@@ -62,7 +63,7 @@ class MCPClient:
                 
                 logger.info("MCP Client initialized successfully")
             except ImportError as e:
-                logger.error(f"Failed to import MCP libraries: {str(e)}")
+                logger.error("Failed to import MCP libraries: %s", e)
                 logger.error("Install required packages: pip install mcp anthropic")
                 self.enabled = False
     
@@ -84,32 +85,32 @@ class MCPClient:
             logger.error("Anthropic client not initialized. Cannot connect to server.")
             return False
             
-        try:
-            # Initialize exit stack for resource management
-            self.exit_stack = AsyncExitStack()
+        # Determine script type
+        script_type = self._get_script_type(server_script_path)
+        if not script_type:
+            logger.error("Unsupported script type for MCP server: %s", server_script_path)
+            return False
             
-            # Determine script type
-            script_type = self._get_script_type(server_script_path)
-            if not script_type:
-                logger.error(f"Unsupported script type for MCP server: {server_script_path}")
-                return False
-                
-            # Create server parameters
-            if script_type == "python":
-                cmd = [sys.executable, server_script_path]
-            elif script_type == "node":
-                cmd = ["node", server_script_path]
-            else:
-                logger.error(f"Unsupported script type: {script_type}")
-                return False
-                
-            # Connect to server
-            logger.info(f"Connecting to MCP server: {server_script_path}")
+        # Build the server command
+        if script_type == "python":
+            cmd = [sys.executable, server_script_path]
+        elif script_type == "node":
+            cmd = ["node", server_script_path]
+        else:
+            logger.error("Unsupported script type: %s", script_type)
+            return False
+            
+        try:
+            # Create server parameters before allocating any async resources
+            logger.info("Connecting to MCP server: %s", server_script_path)
             server_params = StdioServerParameters(
                 command=cmd,
                 cwd=os.path.dirname(os.path.abspath(server_script_path))
             )
             
+            # Initialize exit stack for resource management
+            self.exit_stack = AsyncExitStack()
+            
             # Create client and connect
             connection = await self.exit_stack.enter_async_context(
                 stdio_client(server_params)
@@ -121,16 +122,21 @@ class MCPClient:
             # Initialize session
             await self.session.initialize()
             
-            # List available capabilities (resources, tools, etc.)
-            resources = await self.session.list_resources()
-            tools = await self.session.list_tools() if "tools" in self.session.capabilities else []
+            # List available capabilities (resources, tools, etc.) concurrently
+            if "tools" in self.session.capabilities:
+                resources, tools = await asyncio.gather(
+                    self.session.list_resources(),
+                    self.session.list_tools()
+                )
+            else:
+                resources, tools = await self.session.list_resources(), []
             
-            logger.info(f"Connected to MCP server with {len(resources)} resources and {len(tools)} tools")
+            logger.info("Connected to MCP server with %d resources and %d tools", len(resources), len(tools))
             self.initialized = True
             return True
             
         except Exception as e:
-            logger.error(f"Error connecting to MCP server: {str(e)}")
+            logger.error("Error connecting to MCP server: %s", e)
             
             # Clean up resources
             if self.exit_stack:
@@ -161,7 +167,7 @@ class MCPClient:
             return True
             
         except Exception as e:
-            logger.error(f"Error disconnecting from MCP server: {str(e)}")
+            logger.error("Error disconnecting from MCP server: %s", e)
             return False
     
     async def process_query(self, query: str) -> str:
@@ -184,7 +190,7 @@ class MCPClient:
             
         try:
             # Create a Claude message with MCP context
-            logger.info(f"Processing query with MCP: {query[:50]}...")
+            logger.info("Processing query with MCP: %.50s...", query)
             
             # Get the Claude message with MCP context
             message = await self.anthropic.messages.create(
@@ -218,24 +224,8 @@ class MCPClient:
         Returns:
             Optional[str]: 'python', 'node', or None if unknown
         """
-        # Check extension
-        ext = os.path.splitext(script_path)[1].lower()
-        if ext in ['.py', '.pyw']:
-            return "python"
-        elif ext in ['.js', '.mjs']:
-            return "node"
-            
-        # Check for shebang
-        try:
-            with open(script_path, 'r') as f:
-                first_line = f.readline().strip()
-                if first_line.startswith('#!'):
-                    if 'python' in first_line:
-                        return "python"
-                    elif 'node' in first_line:
-                        return "node"
-        except Exception:
-            pass
-            
-        # Unknown script type
-        return None 
\ No newline at end of file
+        # A known extension decides without touching the file
+        script_type = EXT2TYPE.get(os.path.splitext(script_path)[1].lower())
+        if script_type is not None:
+            return script_type
+        return read_shebang_type(script_path) 
\ No newline at end of file
@@ -10,16 +10,51 @@ import os
 import sys
 import logging
 import asyncio
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, Union
 
 from davincimcp.utils.config import Config
 from davincimcp.utils.exceptions import ConfigError
+from davincimcp.core.mcp.script_type import EXT2TYPE, read_shebang_type
+
+# fcntl is unavailable on Windows; pipe resizing is Linux-only anyway
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 # Logger for this module
 logger = logging.getLogger(__name__)
 
+# Kernel buffer size requested for the server's stdio pipes (default is 64 KiB)
+PIPE_SIZE = 1 << 20
+
+def _pipe_size() -> int:
+    """
+    Get the pipe buffer size to request, capped at the system maximum
+    
+    Returns:
+        int: Pipe buffer size in bytes
+    """
+    try:
+        with open("/proc/sys/fs/pipe-max-size") as f:
+            return min(PIPE_SIZE, int(f.read()))
+    except (OSError, ValueError):
+        return PIPE_SIZE
+
+async def _drain_stderr(stream: asyncio.StreamReader):
+    """
+    Log the server's stderr lines at debug level until it closes
+    
+    Args:
+        stream: The server process's stderr stream
+    """
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        logger.debug("MCP server: %s", line.decode(errors="replace").rstrip())
+
 class MCPHandler:
     """
     Handler for Model Context Protocol (MCP) operations
@@ -39,6 +74,7 @@ class MCPHandler:
         self.server_script = config.get("mcp_server_script", "")
         self.server_capabilities = config.get("mcp_server_capabilities", [])
         self.server_process = None
+        self._stderr_task = None
         self.initialized = False
         
         logger.info(f"MCP Handler initialized (enabled: {self.enabled})")
@@ -85,13 +121,25 @@ class MCPHandler:
                 logger.error(f"Unsupported script type: {script_type}")
                 return False
                 
-            # Start process with pipe communication
+            # Only capture stderr when it will be logged; otherwise the child
+            # inherits ours, avoiding a pipe nobody reads filling up
+            capture_stderr = logger.isEnabledFor(logging.DEBUG)
+            
+            # Start process with pipe communication. close_fds=False lets
+            # CPython use posix_spawn (vfork) instead of fork+exec, so launch
+            # time does not grow with the parent's memory size. Descriptors
+            # opened by Python are non-inheritable by default (PEP 446), so
+            # only the pipes set up here reach the child.
             self.server_process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE if capture_stderr else None,
+                close_fds=False
             )
+            self._enlarge_pipes()
+            if capture_stderr:
+                self._stderr_task = asyncio.create_task(_drain_stderr(self.server_process.stderr))
             
             logger.info(f"MCP server started with PID: {self.server_process.pid}")
             self.initialized = True
@@ -127,6 +175,10 @@ class MCPHandler:
                 self.server_process.kill()
                 await self.server_process.wait()
             
+            if self._stderr_task is not None:
+                self._stderr_task.cancel()
+                self._stderr_task = None
+            
             self.server_process = None
             self.initialized = False
             return True
@@ -135,6 +187,30 @@ class MCPHandler:
             logger.error(f"Error stopping MCP server: {str(e)}")
             return False
     
+    def _enlarge_pipes(self):
+        """
+        Enlarge the kernel buffers of the server's stdio pipes
+        
+        Larger buffers let JSON-RPC frames bigger than the default 64 KiB be
+        transferred without the writer blocking part way through. This is a
+        best-effort tuning, only available on Linux.
+        """
+        if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+            return
+        
+        size = _pipe_size()
+        process = self.server_process
+        for stream in (process.stdin, process.stdout, process.stderr):
+            # StreamWriter exposes its transport; StreamReader only privately
+            transport = getattr(stream, "transport", None) or getattr(stream, "_transport", None)
+            if transport is None:
+                continue
+            try:
+                pipe = transport.get_extra_info("pipe")
+                fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, size)
+            except Exception as e:
+                logger.debug("Could not resize MCP server pipe: %s", e)
+    
     def _get_script_type(self, script_path: Path) -> Optional[str]:
         """
         Determine the type of script (python or node)
@@ -145,27 +221,11 @@ class MCPHandler:
         Returns:
             Optional[str]: 'python', 'node', or None if unknown
         """
-        # Check extension
-        ext = script_path.suffix.lower()
-        if ext in ['.py', '.pyw']:
-            return "python"
-        elif ext in ['.js', '.mjs']:
-            return "node"
-            
-        # Check for shebang
-        try:
-            with open(script_path, 'r') as f:
-                first_line = f.readline().strip()
-                if first_line.startswith('#!'):
-                    if 'python' in first_line:
-                        return "python"
-                    elif 'node' in first_line:
-                        return "node"
-        except Exception:
-            pass
-            
-        # Unknown script type
-        return None
+        # A known extension decides without touching the file
+        script_type = EXT2TYPE.get(script_path.suffix.lower())
+        if script_type is not None:
+            return script_type
+        return read_shebang_type(script_path)
     
     def is_running(self) -> bool:
         """
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+script_type.py - MCP server script type detection
+
+This module provides the script type detection shared by the MCP handler
+and client, so both classify a server script the same way.
+"""
+
+import os
+from types import MappingProxyType
+from typing import Optional, Union
+
+# Script file extension -> script type
+EXT2TYPE = MappingProxyType({
+    ".py": "python",
+    ".pyw": "python",
+    ".js": "node",
+    ".mjs": "node",
+})
+
+# Bytes read from the start of a script to find its shebang line
+SHEBANG_READ_SIZE = 256
+
+def read_shebang_type(script_path: Union[str, "os.PathLike[str]"]) -> Optional[str]:
+    """
+    Determine the type of script from its shebang line
+    
+    Args:
+        script_path: Path to the script
+        
+    Returns:
+        Optional[str]: 'python', 'node', or None if unknown or unreadable
+    """
+    # One raw read, bypassing buffered text IO
+    try:
+        fd = os.open(script_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        try:
+            head = os.read(fd, SHEBANG_READ_SIZE)
+        finally:
+            os.close(fd)
+    except Exception:
+        return None
+    
+    first_line = head.split(b'\n', 1)[0]
+    if first_line.startswith(b'#!'):
+        if b'python' in first_line:
+            return "python"
+        elif b'node' in first_line:
+            return "node"
+    
+    # Unknown script type
+    return None
@@ -27,16 +27,6 @@ class MediaControlHandler:
         """
         self.resolve_controller = resolve_controller
         logger.info("Media Control Handler initialized")
-        
-        # Store supported commands
-        self.supported_commands = {
-            "PlaybackStart": self._playback_start,
-            "PlaybackStop": self._playback_stop,
-            "PlaybackToggle": self._playback_toggle,
-            "JumpToFrameOffset": self._jump_to_frame_offset,
-            "JumpToTimecode": self._jump_to_timecode,
-            "SetPlaybackSpeed": self._set_playback_speed,
-        }
     
     def execute_command(self, command: str, params: Dict[str, Any] = None) -> Union[bool, Dict[str, Any]]:
         """
@@ -53,14 +43,15 @@ class MediaControlHandler:
             params = {}
         
         # Check if command is supported
-        if command not in self.supported_commands:
+        handler = self._DISPATCH.get(command)
+        if handler is None:
             error_msg = f"Unsupported Media Control command: {command}"
             logger.error(error_msg)
             return {"status": "error", "message": error_msg}
             
         try:
             # Execute the command handler
-            result = self.supported_commands[command](params)
+            result = handler(self, params)
             
             # Log command execution
             logger.info(f"Media Control command executed: {command}")
@@ -128,4 +119,18 @@ class MediaControlHandler:
         
         # This would use the ResolveController to set the playback speed
         # Placeholder implementation
-        return {"message": f"Playback speed set to: {speed}x"} 
\ No newline at end of file
+        return {"message": f"Playback speed set to: {speed}x"}
+    
+    # Command name -> handler function, shared by all instances; defined after
+    # the methods so the functions are stored directly instead of their names
+    _DISPATCH = {
+        "PlaybackStart": _playback_start,
+        "PlaybackStop": _playback_stop,
+        "PlaybackToggle": _playback_toggle,
+        "JumpToFrameOffset": _jump_to_frame_offset,
+        "JumpToTimecode": _jump_to_timecode,
+        "SetPlaybackSpeed": _set_playback_speed,
+    }
+    
+    # Supported command names
+    supported_commands = frozenset(_DISPATCH)
@@ -22,6 +22,9 @@ class ResolveController:
         self.current_project = None
         self.connected = False
         
+        # (project, name) of the last project named, to skip a bridge call
+        self._project_name = None
+        
         # These will be imported at runtime to avoid circular imports
         self._bmd = None
 
@@ -67,6 +70,7 @@ class ResolveController:
             
             # Get the current project
             self.current_project = self.project_manager.GetCurrentProject()
+            self._project_name = None
             if self.current_project is None:
                 logger.warning("No project is currently open in DaVinci Resolve")
             else:
@@ -94,7 +98,7 @@ class ResolveController:
             
         try:
             return {
-                "name": self.current_project.GetName(),
+                "name": self._get_project_name(),
                 "timeline_count": self.current_project.GetTimelineCount(),
                 # Add more project info as needed
             }
@@ -102,6 +106,22 @@ class ResolveController:
             logger.error(f"Error getting project info: {str(e)}")
             return {}
     
+    def _get_project_name(self) -> str:
+        """
+        Get the current project's name, cached per project handle
+        
+        Each GetName() is a call across the scripting bridge, and the open
+        project's name does not change while it is open; the timeline count
+        can, so it is always queried.
+        
+        Returns:
+            str: Name of the current project
+        """
+        project = self.current_project
+        if self._project_name is None or self._project_name[0] is not project:
+            self._project_name = (project, project.GetName())
+        return self._project_name[1]
+    
     def get_current_timeline(self):
         """
         Get the current timeline
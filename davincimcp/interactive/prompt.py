@@ -6,8 +6,17 @@ This module provides the interactive command-line interface for DavinciMCP,
 allowing users to enter commands and see results in real time.
 """
 
+import os
+import sys
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Iterator, List, Optional
+
+# readline is unavailable on some platforms (e.g. Windows)
+try:
+    import readline
+except ImportError:
+    readline = None
 
 from davincimcp.core.resolve_controller import ResolveController
 from davincimcp.core.gemini_handler import GeminiAPIHandler
@@ -17,6 +26,224 @@ from davincimcp.media.analyzer import MediaAnalyzer
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Persistent history file for the interactive prompt
+HISTORY_FILE = os.path.expanduser("~/.davincimcp_history")
+
+# Maximum number of lines kept in HISTORY_FILE
+HISTORY_LENGTH = 1000
+
+# Prompt template for AI interpretation of user commands
+_AI_INTERPRET_PROMPT = (
+    "Convert this instruction into a precise editing command for "
+    "DaVinci Resolve: '{command_text}'"
+)
+
+# Built-in prompt commands mapped to the action they trigger
+_BUILTIN_ACTIONS = {
+    "help": "help",
+    "exit": "exit",
+    "quit": "exit",
+    "analyze": "analyze",
+}
+
+# Static prompt text, each written with a single write
+_WELCOME = (
+    "\nDaVinci Resolve MCP Interactive Mode\n"
+    "------------------------------------\n"
+    "Type 'exit' or 'quit' to exit, 'help' for available commands.\n\n"
+)
+_HELP = (
+    "\nAvailable commands:\n"
+    "  help - Show this help message\n"
+    "  exit, quit - Exit the program\n"
+    "  analyze - Analyze the current clip\n"
+    "  <Any natural language command> - Execute command using AI\n"
+)
+
+def read_commands(prompt: str) -> Iterator[str]:
+    """
+    Yield stripped command lines until end of input
+    
+    A terminal is read with input() so the prompt and readline editing work;
+    Ctrl-C or Ctrl-D at the prompt ends the input. Piped input is iterated
+    directly from the buffered sys.stdin without prompt writes, skipping
+    blank lines, so scripted runs avoid per-line overhead.
+    
+    Args:
+        prompt: Prompt shown before each line on a terminal
+        
+    Returns:
+        Iterator[str]: Stripped command lines
+    """
+    if sys.stdin.isatty():
+        while True:
+            try:
+                line = input(prompt)
+            except (KeyboardInterrupt, EOFError):
+                print()
+                return
+            yield line.strip()
+    else:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                yield line
+
+def _interpret_with_ai(gemini_handler: GeminiAPIHandler, command_text: str) -> Optional[str]:
+    """
+    Ask Gemini to rephrase a command as a precise editing command
+    
+    The response is streamed and only its first line is kept: that is the
+    command, and stopping there skips waiting for any explanation the model
+    adds after it. The request runs on a daemon thread while the prompt
+    thread waits, so Ctrl-C abandons a slow request (blocking gRPC calls
+    ignore it) without ending the session or blocking interpreter exit.
+    
+    Args:
+        gemini_handler: Initialized Gemini API handler
+        command_text: Command as typed by the user
+        
+    Returns:
+        Optional[str]: The AI's interpretation, the typed command if the
+            request failed, or None if abandoned
+    """
+    response: List[str] = []
+    done = threading.Event()
+    
+    def request():
+        try:
+            text = first_line = ""
+            for chunk in gemini_handler.generate_response_stream(
+                _AI_INTERPRET_PROMPT.format(command_text=command_text)
+            ):
+                text += chunk
+                first_line, newline, _ = text.lstrip().partition("\n")
+                if newline:
+                    break
+            first_line = first_line.strip()
+            # Failures come back as "Error: ..." text; never phrase-match it
+            if first_line and not first_line.startswith("Error:"):
+                response.append(first_line)
+            else:
+                logger.warning("AI interpretation failed: %s", first_line or "empty response")
+        except Exception as e:
+            logger.error("Error interpreting command with AI: %s", e)
+        finally:
+            done.set()
+    
+    threading.Thread(target=request, name="gemini-request", daemon=True).start()
+    try:
+        done.wait()
+    except KeyboardInterrupt:
+        return None
+    
+    # Fall back to the typed command if the request failed
+    return response[0] if response else command_text
+
+def _setup_readline(command_executor: CommandExecutor) -> bool:
+    """
+    Configure readline history and tab completion for the prompt
+    
+    Completion offers built-in commands, command IDs and their NLP phrases,
+    so a completed command ID can be executed without phrase matching.
+    
+    Args:
+        command_executor: Command executor whose registry provides completions
+        
+    Returns:
+        bool: True if readline is available and configured
+    """
+    # Piped input is read directly from stdin, without readline
+    if readline is None or not sys.stdin.isatty():
+        return False
+    
+    registry = command_executor.registry
+    candidates: List[str] = list(_BUILTIN_ACTIONS)
+    candidates.extend(registry.commands.keys())
+    for phrases in registry.nlp_matchers.values():
+        candidates.extend(phrases)
+    candidates = sorted(set(candidates))
+    
+    def complete(text: str, state: int) -> Optional[str]:
+        line = readline.get_line_buffer().lstrip().lower()
+        matches = [c for c in candidates if c.startswith(line)]
+        if state < len(matches):
+            # Only complete the part of the candidate after the current word
+            return matches[state][len(line) - len(text):]
+        return None
+    
+    readline.set_completer(complete)
+    readline.set_completer_delims(" ")
+    readline.parse_and_bind("tab: complete")
+    
+    # Bound the history kept in memory and written back to HISTORY_FILE
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    return True
+
+def _save_readline_history():
+    """Write the prompt history to HISTORY_FILE"""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError as e:
+        logger.warning("Could not save command history: %s", e)
+
+def _format_clip_analysis(analysis: Dict[str, Any]) -> List[str]:
+    """
+    Format clip analysis results as output lines
+    
+    Args:
+        analysis: Analysis results from the media analyzer
+        
+    Returns:
+        List[str]: Lines to print
+    """
+    lines = ["", "Analysis results:"]
+    lines.extend(f"  {key}: {value}" for key, value in analysis.items())
+    return lines
+
+def _format_edit_suggestions(suggestions: List[Any]) -> List[str]:
+    """
+    Format numbered edit suggestions as output lines
+    
+    Args:
+        suggestions: Edit suggestions to print
+        
+    Returns:
+        List[str]: Lines to print
+    """
+    lines = ["", "Edit suggestions:"]
+    lines.extend(f"  {i}. {suggestion}" for i, suggestion in enumerate(suggestions, 1))
+    return lines
+
+def _format_result(result: Dict[str, Any]) -> List[str]:
+    """
+    Format a command result and its feedback as output lines
+    
+    Args:
+        result: Result of the command execution
+        
+    Returns:
+        List[str]: Lines to print
+    """
+    lines = [f"Result: {result.get('status', 'unknown')}"]
+    feedback = result.get('feedback')
+    if feedback:
+        lines.append(f"Feedback: {feedback}")
+    return lines
+
+def _write_lines(lines: List[str]):
+    """
+    Write output lines to stdout with a single write
+    
+    Args:
+        lines: Lines to write
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def run_interactive_session(
     command_executor: CommandExecutor,
     gemini_handler: GeminiAPIHandler,
@@ -35,90 +262,109 @@ def run_interactive_session(
     Returns:
         int: Exit code (0 for success, non-zero for errors)
     """
-    # Show welcome message
-    print("\nDaVinci Resolve MCP Interactive Mode")
-    print("------------------------------------")
-    print("Type 'exit' or 'quit' to exit, 'help' for available commands.\n")
-    
     # Check if connected to Resolve
     project_info = controller.get_project_info()
     if project_info:
-        print(f"Connected to project: {project_info.get('name', 'Unknown')}")
+        status_line = f"Connected to project: {project_info.get('name', 'Unknown')}"
     else:
-        print("Warning: Not connected to a DaVinci Resolve project.")
+        status_line = "Warning: Not connected to a DaVinci Resolve project."
+    
+    # Show welcome message
+    sys.stdout.write(f"{_WELCOME}{status_line}\n")
+    
+    use_readline = _setup_readline(command_executor)
+    try:
+        return _run_loop(command_executor, gemini_handler, media_analyzer)
+    finally:
+        if use_readline:
+            _save_readline_history()
+
+def _run_loop(
+    command_executor: CommandExecutor,
+    gemini_handler: GeminiAPIHandler,
+    media_analyzer: MediaAnalyzer
+) -> int:
+    """
+    Read and execute commands until the user exits
     
+    Args:
+        command_executor: Command executor for handling operations
+        gemini_handler: Gemini API handler for AI integration
+        media_analyzer: Media analyzer for content analysis
+        
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
     # Main loop
-    while True:
-        # Get user input
-        try:
-            command_text = input("\nDavinciMCP> ").strip()
-        except KeyboardInterrupt:
-            print("\nExiting...")
-            return 0
-        except EOFError:
-            print("\nExiting...")
-            return 0
+    for command_text in read_commands("\nDavinciMCP> "):
+        # Built-in commands are whole lines, resolved with a single lookup
+        action = _BUILTIN_ACTIONS.get(command_text.lower())
         
         # Check for exit command
-        if command_text.lower() in ["exit", "quit"]:
+        if action == "exit":
             print("Exiting...")
             return 0
         
         # Check for help command
-        if command_text.lower() == "help":
-            print("\nAvailable commands:")
-            print("  help - Show this help message")
-            print("  exit, quit - Exit the program")
-            print("  analyze - Analyze the current clip")
-            print("  <Any natural language command> - Execute command using AI")
+        if action == "help":
+            sys.stdout.write(_HELP)
             continue
         
         # Check for analyze command
-        if command_text.lower() == "analyze":
+        if action == "analyze":
+            # Shown before the analysis starts, as progress feedback
             print("\nAnalyzing current clip...")
             try:
                 analysis = media_analyzer.analyze_current_clip()
                 if analysis:
-                    print("\nAnalysis results:")
-                    for key, value in analysis.items():
-                        print(f"  {key}: {value}")
+                    out = _format_clip_analysis(analysis)
                     
                     # Get edit suggestions
                     suggestions = media_analyzer.generate_suggestions(analysis)
                     if suggestions:
-                        print("\nEdit suggestions:")
-                        for i, suggestion in enumerate(suggestions, 1):
-                            print(f"  {i}. {suggestion}")
+                        out.extend(_format_edit_suggestions(suggestions))
+                    _write_lines(out)
                 else:
                     print("No analysis data available.")
             except Exception as e:
-                logger.error(f"Error analyzing clip: {str(e)}")
+                logger.error("Error analyzing clip: %s", e)
                 print(f"Error analyzing clip: {str(e)}")
             continue
         
         # Process with AI and execute command
+        out: List[str] = []
         try:
-            if not gemini_handler.initialized:
-                print("Warning: AI not initialized. Processing as direct command.")
+            if command_text in command_executor.registry.commands:
+                # Exact command ID (e.g. from tab completion), no matching needed
+                result = command_executor.execute_command(command_text)
+            elif command_executor.registry.match_nlp_intent(command_text) is not None:
+                # Already a known command phrase, skip the AI round-trip
+                result = command_executor.execute_from_text(command_text)
+            elif not gemini_handler.initialized:
+                out.append("Warning: AI not initialized. Processing as direct command.")
                 result = command_executor.execute_from_text(command_text)
             else:
-                # Process with AI first
+                # Process with AI first; shown before the request as progress feedback
                 print("Processing with AI...")
-                ai_interpretation = gemini_handler.generate_response(
-                    f"Convert this instruction into a precise editing command for DaVinci Resolve: '{command_text}'"
-                )
+                ai_interpretation = _interpret_with_ai(gemini_handler, command_text)
+                if ai_interpretation is None:
+                    print("AI request abandoned.")
+                    continue
                 
-                # Execute the command
-                print(f"Executing command: {command_text}")
-                result = command_executor.execute_from_text(command_text, ai_context=ai_interpretation)
+                # Execute the AI's command if it is one we understand
+                if command_executor.registry.match_nlp_intent(ai_interpretation) is not None:
+                    command_text = ai_interpretation
+                out.append(f"Executing command: {command_text}")
+                result = command_executor.execute_from_text(command_text)
             
             # Show result
-            print(f"Result: {result.get('status', 'unknown')}")
-            if result.get('feedback'):
-                print(f"Feedback: {result.get('feedback')}")
+            out.extend(_format_result(result))
+            _write_lines(out)
                 
         except Exception as e:
-            logger.error(f"Error executing command: {str(e)}")
-            print(f"Error executing command: {str(e)}")
+            logger.error("Error executing command: %s", e)
+            out.append(f"Error executing command: {str(e)}")
+            _write_lines(out)
     
+    print("Exiting...")
     return 0 
\ No newline at end of file
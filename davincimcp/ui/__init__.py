@@ -13,8 +13,22 @@ __all__ = [
     'run_app'
 ]
 
-from davincimcp.ui.main_window import MainWindow
-from davincimcp.ui.timeline_view import TimelineView
-from davincimcp.ui.command_panel import CommandPanel
-from davincimcp.ui.media_browser import MediaBrowser
-from davincimcp.ui.app import run_app 
\ No newline at end of file
+import importlib
+
+# UI components, imported lazily on first attribute access (PEP 562) so that
+# importing one UI module does not load every widget module
+_LAZY_IMPORTS = {
+    'MainWindow': 'davincimcp.ui.main_window',
+    'TimelineView': 'davincimcp.ui.timeline_view',
+    'CommandPanel': 'davincimcp.ui.command_panel',
+    'MediaBrowser': 'davincimcp.ui.media_browser',
+    'run_app': 'davincimcp.ui.app',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,14 @@ This module provides the main entry point for running the DavinciMCP application
 with a graphical user interface using PySide6.
 """
 
+import os
 import sys
 import logging
+import threading
 from typing import Optional, List
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QCoreApplication, Qt
 
-from davincimcp.ui.main_window import MainWindow
+# PySide6 and the widget modules are imported by run_app, so importing this
+# module (e.g. through the davincimcp.ui package) does not load Qt
 from davincimcp.core.resolve_controller import ResolveController
 from davincimcp.core.gemini_handler import GeminiAPIHandler
 from davincimcp.utils.config import Config
@@ -20,6 +21,9 @@ from davincimcp.utils.config import Config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Qt platform plugins without a display, where DPI settings are irrelevant
+_HEADLESS_PLATFORMS = frozenset({"offscreen", "minimal"})
+
 def run_app(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the GUI application
@@ -30,42 +34,88 @@ def run_app(args: Optional[List[str]] = None) -> int:
     Returns:
         int: Exit code (0 for success, non-zero for errors)
     """
-    # Set application information
-    QCoreApplication.setApplicationName("DavinciMCP")
-    QCoreApplication.setOrganizationName("Colton Batts")
-    QCoreApplication.setApplicationVersion("0.1.0")
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    
+    from davincimcp.ui.main_window import MainWindow
     
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
+    # Enable high DPI scaling, except on headless platforms with no screens
+    if os.environ.get("QT_QPA_PLATFORM") not in _HEADLESS_PLATFORMS:
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
     
     # Create Qt application
     app = QApplication(sys.argv if args is None else args)
     
+    # Set application information
+    app.setApplicationName("DavinciMCP")
+    app.setOrganizationName("Colton Batts")
+    app.setApplicationVersion("0.1.0")
+    
     # Initialize configuration
     config = Config()
     
     # Initialize the Resolve controller
     controller = ResolveController()
     
-    # Attempt to connect to Resolve
-    resolve_connected = controller.connect()
-    if not resolve_connected:
-        logger.warning("Could not connect to DaVinci Resolve. Some features will be limited.")
+    # Create and show main window; Resolve and Gemini are set up in the
+    # background, as both block on I/O and are independent of the window
+    main_window = MainWindow(controller, None, config)
     
-    # Initialize Gemini handler
-    gemini_handler = None
-    if config.gemini_api_key:
-        gemini_handler = GeminiAPIHandler(config.gemini_api_key)
-        if not gemini_handler.initialized:
+    # The controller is not thread-safe: no manual connect while the startup
+    # connect runs (the window re-enables the action when it reports back)
+    main_window.connect_action.setEnabled(False)
+    main_window.show()
+    
+    # Results arriving after quit are dropped, as the window may be gone
+    quitting = threading.Event()
+    app.aboutToQuit.connect(quitting.set)
+    
+    def deliver(emit):
+        """Emit a startup result on the window unless it has gone away"""
+        if quitting.is_set():
+            return
+        try:
+            emit()
+        except RuntimeError:
+            # The window's C++ object was deleted during shutdown
+            pass
+    
+    def connect_resolve():
+        """Connect to Resolve and report the result to the window"""
+        try:
+            connected = controller.connect()
+        except Exception as e:
+            logger.error("Error connecting to DaVinci Resolve: %s", e)
+            connected = False
+        if not connected:
+            logger.warning("Could not connect to DaVinci Resolve. Some features will be limited.")
+        deliver(lambda: main_window.resolve_connected.emit(connected))
+    
+    def init_gemini():
+        """Initialize the Gemini handler and hand it to the window"""
+        try:
+            gemini_handler = GeminiAPIHandler(config.gemini_api_key)
+        except Exception as e:
+            logger.error("Error initializing Gemini API: %s", e)
+            gemini_handler = None
+        if gemini_handler is None or not gemini_handler.initialized:
             logger.warning("Failed to initialize Gemini API. AI features will be disabled.")
+        deliver(lambda: main_window.gemini_ready.emit(gemini_handler))
+    
+    # Daemon threads, so a hung connect cannot keep the process alive after
+    # the window closes; the window's signals are queued to the GUI thread
+    # when emitted from them, so the GUI thread never waits on either
+    threading.Thread(target=connect_resolve, name="startup-resolve", daemon=True).start()
+    if config.gemini_api_key:
+        threading.Thread(target=init_gemini, name="startup-gemini", daemon=True).start()
     else:
         logger.warning("No Gemini API key found. AI features will be disabled.")
     
-    # Create and show main window
-    main_window = MainWindow(controller, gemini_handler, config)
-    main_window.show()
-    
     # Run the application
-    return app.exec() 
\ No newline at end of file
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(run_app())
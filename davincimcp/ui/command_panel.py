@@ -6,14 +6,18 @@ This module provides the CommandPanel class for entering and executing
 natural language commands via the Gemini AI integration.
 """
 
+import html
 import logging
-from typing import Optional, List
+import itertools
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QLineEdit, QLabel, QComboBox, QSizePolicy
+    QPlainTextEdit, QLineEdit, QLabel, QComboBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
-from PySide6.QtGui import QTextCursor, QFont, QColor, QPalette
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QTextCursor, QFont, QColor, QPalette, QKeySequence, QShortcut
 
 from davincimcp.core.resolve_controller import ResolveController
 from davincimcp.core.gemini_handler import GeminiAPIHandler
@@ -22,14 +26,136 @@ from davincimcp.commands.command_registry import CommandRegistry, CommandExecuto
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prompt template for AI interpretation of user commands
+_AI_INTERPRET_PROMPT = (
+    "Convert this instruction into a precise editing command for "
+    "DaVinci Resolve: '{command_text}'"
+)
+
+# Placeholder entry shown first in the suggestion dropdown
+_SUGGESTION_PLACEHOLDER = "Select a suggestion or type your own..."
+
+# Common commands offered in the suggestion dropdown
+_COMMON_COMMANDS = [
+    _SUGGESTION_PLACEHOLDER,
+    "Add a cross dissolve transition that's 1.5 seconds",
+    "Cut the clip at the current position",
+    "Analyze this long take and suggest edits",
+    "Add a fade to black at the end",
+    "Speed up this clip by 20%",
+    "Add a title with text 'Scene 1'",
+    "Apply color correction to make it warmer",
+    "Export the current timeline as MP4",
+    "Undo the last operation",
+]
+
+# Demonstration responses, keyed on the command keyword that triggers them;
+# keywords are checked in this (priority) order and the first one found wins
+_DEMO_RESPONSES = {
+    "cross dissolve": (
+        "Added a cross dissolve transition of 1.5 seconds to the selected clip",
+    ),
+    "cut": (
+        "Cut the current clip at the playhead position",
+    ),
+    "analyze": (
+        "Analyzing the current clip...",
+        "Analysis suggests cuts at 00:05, 00:12, and 00:23 based on content changes",
+    ),
+}
+
+def _cache_key(command_text: str) -> str:
+    """Normalize command text for the interpretation cache"""
+    return " ".join(command_text.lower().split())
+
+@lru_cache(maxsize=None)
+def _history_font() -> QFont:
+    """Build the monospace history font, once per process"""
+    return QFont("Courier New", 10)
+
+@lru_cache(maxsize=None)
+def _history_palette() -> QPalette:
+    """
+    Build the history display palette, once per process
+    
+    Only the roles set here override the palette inherited from the parent.
+    
+    Returns:
+        QPalette: History display palette
+    """
+    palette = QPalette()
+    palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    palette.setColor(QPalette.Text, QColor(220, 220, 220))
+    return palette
+
+class _InterpretSignals(QObject):
+    """Signals of an _InterpretWorker, delivered on the GUI thread"""
+    
+    # Request ID, AI reply (or None), error message (or None)
+    finished = Signal(int, object, object)
+
+class _InterpretWorker(QRunnable):
+    """
+    Runs a command's AI interpretation request on the global thread pool
+    
+    The worker only calls the Gemini handler it was given; matching and
+    caching the reply happen on the GUI thread.
+    """
+    
+    def __init__(self, request_id: int, gemini_handler: GeminiAPIHandler, command_text: str):
+        super().__init__()
+        self.request_id = request_id
+        self.gemini_handler = gemini_handler
+        self.command_text = command_text
+        
+        # Created on the GUI thread, so connected slots run there
+        self.signals = _InterpretSignals()
+    
+    def run(self):
+        """Request the interpretation and report the outcome"""
+        try:
+            reply = self.gemini_handler.generate_response(
+                _AI_INTERPRET_PROMPT.format(command_text=self.command_text)
+            )
+        except Exception as e:
+            logger.error("Error interpreting command: %s", e)
+            self.signals.finished.emit(self.request_id, None, str(e))
+            return
+        
+        # The handler reports failures as "Error: ..." replies
+        if reply.startswith("Error:"):
+            self.signals.finished.emit(self.request_id, None, reply[len("Error:"):].strip())
+        else:
+            self.signals.finished.emit(self.request_id, reply, None)
+
 class CommandPanel(QWidget):
     """
     Panel for entering and executing natural language commands
+    
+    command_executed is emitted once a command finishes, which may be after
+    its AI interpretation returns from the thread pool; consumers should
+    connect to it with Qt.QueuedConnection so their slots always run from
+    the event loop.
     """
     
     # Signals
     command_executed = Signal(str, bool)  # Command text, success
     
+    # History message type -> text color
+    _COLOR_MAP = {
+        "red": "#ff6464",
+        "green": "#64ff64",
+        "blue": "#64b4ff",
+        "orange": "#ffb464",
+    }
+    _DEFAULT_COLOR = "#dcdcdc"
+    
+    # Number of entered commands kept for Up/Down navigation
+    _HISTORY_MAX = 200
+    
+    # Number of AI command interpretations kept
+    _INTERPRETATION_CACHE_MAX = 256
+    
     def __init__(
         self, 
         controller: Optional[ResolveController] = None,
@@ -40,9 +166,22 @@ class CommandPanel(QWidget):
         
         self.controller = controller
         self.gemini_handler = gemini_handler
-        self.command_history = []
+        self.command_history = deque(maxlen=self._HISTORY_MAX)
         self.history_index = -1
         
+        # Normalized command text -> matched command, for commands the AI
+        # interpreted; cleared when the project or AI handler changes
+        self._interpretations: Dict[str, Dict[str, Any]] = {}
+        
+        # Bumped when the cache is cleared, so replies to requests sent
+        # before the clear are not cached
+        self._cache_generation = 0
+        
+        # Request ID -> (command text, cache generation, worker signals) of
+        # commands awaiting their AI interpretation
+        self._request_ids = itertools.count()
+        self._pending: Dict[int, Tuple[str, int, _InterpretSignals]] = {}
+        
         # Set up command system
         if self.controller:
             self.command_registry = CommandRegistry(self.controller)
@@ -66,19 +205,15 @@ class CommandPanel(QWidget):
         layout = QVBoxLayout(self)
         
         # Command history display
-        self.history_display = QTextEdit()
+        # Plain text layout is cheaper for an append-only log; colors come
+        # from the HTML spans passed to appendHtml()
+        self.history_display = QPlainTextEdit()
         self.history_display.setReadOnly(True)
         self.history_display.setMinimumHeight(100)
         
-        # Set monospace font for history display
-        font = QFont("Courier New", 10)
-        self.history_display.setFont(font)
-        
-        # Custom colors for history display
-        palette = self.history_display.palette()
-        palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        palette.setColor(QPalette.Text, QColor(220, 220, 220))
-        self.history_display.setPalette(palette)
+        # Set monospace font and custom colors for history display
+        self.history_display.setFont(_history_font())
+        self.history_display.setPalette(_history_palette())
         
         layout.addWidget(self.history_display)
         
@@ -96,6 +231,13 @@ class CommandPanel(QWidget):
         self.command_input.setPlaceholderText("Enter a command (e.g., 'Add a cross dissolve transition that's 1.5 seconds')")
         self.command_input.returnPressed.connect(self._execute_command)
         
+        # Up/Down navigate the command history; widget shortcuts only reach
+        # Python for these two keys, not for every keystroke
+        for key, slot in ((Qt.Key_Up, self._history_prev), (Qt.Key_Down, self._history_next)):
+            shortcut = QShortcut(QKeySequence(key), self.command_input)
+            shortcut.setContext(Qt.WidgetShortcut)
+            shortcut.activated.connect(slot)
+        
         # Execute button
         self.execute_button = QPushButton("Execute")
         self.execute_button.clicked.connect(self._execute_command)
@@ -113,28 +255,16 @@ class CommandPanel(QWidget):
     
     def _populate_suggestions(self):
         """Populate the suggestion dropdown with common commands"""
-        common_commands = [
-            "Select a suggestion or type your own...",
-            "Add a cross dissolve transition that's 1.5 seconds",
-            "Cut the clip at the current position",
-            "Analyze this long take and suggest edits",
-            "Add a fade to black at the end",
-            "Speed up this clip by 20%",
-            "Add a title with text 'Scene 1'",
-            "Apply color correction to make it warmer",
-            "Export the current timeline as MP4",
-            "Undo the last operation"
-        ]
-        
         self.suggestion_dropdown.clear()
-        for command in common_commands:
-            self.suggestion_dropdown.addItem(command)
+        self.suggestion_dropdown.addItems(_COMMON_COMMANDS)
     
+    @Slot(str)
     def _handle_suggestion_selected(self, text: str):
         """Handle a suggestion being selected from the dropdown"""
-        if text != "Select a suggestion or type your own...":
+        if text != _SUGGESTION_PLACEHOLDER:
             self.command_input.setText(text)
     
+    @Slot()
     def _execute_command(self):
         """Execute the current command"""
         command_text = self.command_input.text().strip()
@@ -142,95 +272,175 @@ class CommandPanel(QWidget):
             return
         
         # Add command to history display
-        self._add_to_history(f"Command: {command_text}", "blue")
+        history_lines = [(f"Command: {command_text}", "blue")]
         
-        # Add to command history list
-        self.command_history.append(command_text)
+        # Add to command history list, skipping an immediate repeat
+        if not self.command_history or self.command_history[-1] != command_text:
+            self.command_history.append(command_text)
         self.history_index = len(self.command_history)
         
         # Check if resolve is connected
         if not self.controller or not self.controller.connected:
-            self._add_to_history("Error: Not connected to DaVinci Resolve", "red")
+            history_lines.append(("Error: Not connected to DaVinci Resolve", "red"))
+            self._add_lines_to_history(history_lines)
             self.feedback_label.setText("Error: Not connected to DaVinci Resolve")
             return
         
-        # Execute command using AI if available
-        success = False
+        # Interpret the command with AI, if available, off the GUI thread
         if self.gemini_handler and self.gemini_handler.initialized and self.command_executor:
-            try:
-                # In a real implementation, this would use the AI to interpret the command
-                # and then execute it using the command executor
-                
-                # For demonstration, we'll just show a simulated response
-                simulated_result = f"Executed: {command_text}"
-                self._add_to_history(simulated_result, "green")
-                
-                # Process specific known commands for the demonstration
-                if "cross dissolve" in command_text.lower():
-                    self._add_to_history("Added a cross dissolve transition of 1.5 seconds to the selected clip", "green")
-                elif "cut" in command_text.lower():
-                    self._add_to_history("Cut the current clip at the playhead position", "green")
-                elif "analyze" in command_text.lower():
-                    self._add_to_history("Analyzing the current clip...", "green")
-                    self._add_to_history("Analysis suggests cuts at 00:05, 00:12, and 00:23 based on content changes", "green")
+            self._add_lines_to_history(history_lines)
+            self.command_input.clear()
+            
+            # Repeated commands reuse their cached interpretation
+            interpretation = self._interpretations.get(_cache_key(command_text))
+            if interpretation is not None:
+                self._finish_command(command_text, interpretation, None)
+                return
+            
+            self.feedback_label.setText("Interpreting command...")
+            request_id = next(self._request_ids)
+            worker = _InterpretWorker(request_id, self.gemini_handler, command_text)
+            worker.signals.finished.connect(self._on_interpretation)
+            self._pending[request_id] = (command_text, self._cache_generation, worker.signals)
+            QThreadPool.globalInstance().start(worker)
+            return
+        
+        history_lines.append(("Error: AI integration not available", "orange"))
+        self.feedback_label.setText("Error: AI integration not available")
+        self._add_lines_to_history(history_lines)
+        
+        # Clear the input field
+        self.command_input.clear()
+        
+        # Emit signal
+        self.command_executed.emit(command_text, False)
+    
+    @Slot(int, object, object)
+    def _on_interpretation(self, request_id: int, reply: Optional[str], error: Optional[str]):
+        """
+        Match, cache and execute a command once its AI reply arrives
+        
+        Successful interpretations are cached on the normalized text, so
+        repeated commands (such as the fixed suggestions) skip the AI request.
+        Failures are not cached, so they are retried.
+        
+        Args:
+            request_id: ID the request was submitted under
+            reply: The AI's reply, or None if the request failed
+            error: Error message if the request failed
+        """
+        command_text, generation, _ = self._pending.pop(request_id)
+        
+        interpretation = None
+        if error is None:
+            interpretation = self.command_registry.match_nlp_intent(
+                reply.strip().split("\n", 1)[0]
+            )
+            if interpretation is not None and generation == self._cache_generation:
+                if len(self._interpretations) >= self._INTERPRETATION_CACHE_MAX:
+                    # Evict the oldest entry
+                    del self._interpretations[next(iter(self._interpretations))]
+                self._interpretations[_cache_key(command_text)] = interpretation
+        
+        self._finish_command(command_text, interpretation, error)
+    
+    def _finish_command(self, command_text: str, interpretation: Optional[Dict[str, Any]],
+                        error: Optional[str]):
+        """
+        Execute an interpreted command and report the outcome
+        
+        Args:
+            command_text: Command as typed by the user
+            interpretation: Matched command_id and params, or None
+            error: Error message if the interpretation failed
+        """
+        history_lines: List[Tuple[str, str]] = []
+        
+        success = False
+        try:
+            if error is not None:
+                history_lines.append((f"Error: {error}", "red"))
+                self.feedback_label.setText(f"Error: {error}")
+            else:
+                if interpretation is not None:
+                    result = self.command_executor.execute_command(
+                        interpretation["command_id"],
+                        interpretation["params"],
+                        command_text
+                    )
+                    history_lines.append((f"Executed: {interpretation['command_id']}", "green"))
+                    if result.get("feedback"):
+                        history_lines.append((result["feedback"], "green"))
+                else:
+                    # For demonstration, we'll just show a simulated response
+                    simulated_result = f"Executed: {command_text}"
+                    history_lines.append((simulated_result, "green"))
+                    
+                    # Process specific known commands for the demonstration
+                    lowered = command_text.lower()
+                    keyword = next((k for k in _DEMO_RESPONSES if k in lowered), None)
+                    if keyword:
+                        history_lines.extend((line, "green") for line in _DEMO_RESPONSES[keyword])
                 
                 success = True
                 self.feedback_label.setText("Command executed successfully")
-            except Exception as e:
-                logger.error(f"Error executing command: {e}")
-                self._add_to_history(f"Error: {str(e)}", "red")
-                self.feedback_label.setText(f"Error: {str(e)}")
-        else:
-            self._add_to_history("Error: AI integration not available", "orange")
-            self.feedback_label.setText("Error: AI integration not available")
+        except Exception as e:
+            logger.error("Error executing command: %s", e)
+            history_lines.append((f"Error: {str(e)}", "red"))
+            self.feedback_label.setText(f"Error: {str(e)}")
         
-        # Clear the input field
-        self.command_input.clear()
+        # Show this command's history lines with a single append
+        self._add_lines_to_history(history_lines)
         
         # Emit signal
         self.command_executed.emit(command_text, success)
     
+    def clear_interpretation_cache(self):
+        """Forget cached AI interpretations, e.g. after the project changes"""
+        self._interpretations.clear()
+        self._cache_generation += 1
+    
     def _add_to_history(self, text: str, color: str):
         """Add text to history display with color"""
-        cursor = self.history_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Set color based on message type
-        if color == "red":
-            self.history_display.setTextColor(QColor(255, 100, 100))
-        elif color == "green":
-            self.history_display.setTextColor(QColor(100, 255, 100))
-        elif color == "blue":
-            self.history_display.setTextColor(QColor(100, 180, 255))
-        elif color == "orange":
-            self.history_display.setTextColor(QColor(255, 180, 100))
-        else:
-            self.history_display.setTextColor(QColor(220, 220, 220))
-        
-        # Insert text and add newline
-        self.history_display.insertPlainText(text + "\n")
+        self._add_lines_to_history([(text, color)])
+    
+    def _add_lines_to_history(self, lines: List[Tuple[str, str]]):
+        """
+        Add colored lines to the history display with a single append
         
-        # Scroll to the bottom
-        self.history_display.verticalScrollBar().setValue(
-            self.history_display.verticalScrollBar().maximum()
+        Args:
+            lines: (text, color) pairs, where color is a _COLOR_MAP key
+        """
+        fragment = "<br>".join(
+            f'<span style="color:{self._COLOR_MAP.get(color, self._DEFAULT_COLOR)}">'
+            f'{html.escape(text)}</span>'
+            for text, color in lines
         )
-    
-    def keyPressEvent(self, event):
-        """Handle key press events for command history"""
-        if self.command_input.hasFocus():
-            if event.key() == Qt.Key_Up:
-                # Navigate command history backward
-                if self.history_index > 0:
-                    self.history_index -= 1
-                    self.command_input.setText(self.command_history[self.history_index])
-            elif event.key() == Qt.Key_Down:
-                # Navigate command history forward
-                if self.history_index < len(self.command_history) - 1:
-                    self.history_index += 1
-                    self.command_input.setText(self.command_history[self.history_index])
-                else:
-                    self.history_index = len(self.command_history)
-                    self.command_input.clear()
         
-        # Pass event to parent
-        super().keyPressEvent(event) 
\ No newline at end of file
+        # Append and scroll with updates off, so they are painted only once
+        self.history_display.setUpdatesEnabled(False)
+        try:
+            self.history_display.appendHtml(fragment)
+            
+            # Scroll to the bottom
+            self.history_display.moveCursor(QTextCursor.End)
+            self.history_display.ensureCursorVisible()
+        finally:
+            self.history_display.setUpdatesEnabled(True)
+    
+    @Slot()
+    def _history_prev(self):
+        """Navigate command history backward"""
+        if self.history_index > 0:
+            self.history_index -= 1
+            self.command_input.setText(self.command_history[self.history_index])
+    
+    @Slot()
+    def _history_next(self):
+        """Navigate command history forward"""
+        if self.history_index < len(self.command_history) - 1:
+            self.history_index += 1
+            self.command_input.setText(self.command_history[self.history_index])
+        else:
+            self.history_index = len(self.command_history)
+            self.command_input.clear()
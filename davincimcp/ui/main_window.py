@@ -6,14 +6,16 @@ This module provides the MainWindow class, which serves as the primary
 container for all UI components in the DavinciMCP application.
 """
 
+import time
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QDockWidget, QMenuBar, QStatusBar, QLabel,
-    QMenu, QMessageBox, QToolBar, QSizePolicy
+    QMessageBox, QToolBar, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, Signal, Slot
 from PySide6.QtGui import QAction, QIcon, QColor, QPalette
 
 from davincimcp.core.resolve_controller import ResolveController
@@ -26,10 +28,67 @@ from davincimcp.ui.media_browser import MediaBrowser
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Window actions: (attribute, text, slot method, toolbar icon text or None)
+_ACTION_SPEC = (
+    ("connect_action", "&Connect to Resolve", "_connect_to_resolve", "Connect"),
+    ("exit_action", "E&xit", "close", None),
+    ("configure_gemini_action", "&Configure Gemini API", "_configure_gemini", None),
+    ("test_ai_action", "&Test AI Connection", "_test_ai_connection", None),
+    ("about_action", "&About", "_show_about_dialog", None),
+    ("analyze_action", "Analyze Current", "_analyze_current_clip", None),
+)
+
+# Menus in menu bar order: (title, action attributes), None is a separator
+_MENU_SPEC = (
+    ("&File", ("connect_action", None, "exit_action")),
+    ("&Edit", ()),
+    ("&View", ("media_dock_action",)),
+    ("&Tools", ()),
+    ("&AI", ("configure_gemini_action", "test_ai_action")),
+    ("&Help", ("about_action",)),
+)
+
+# Toolbar action attributes, in order
+_TOOLBAR_SPEC = ("connect_action", "analyze_action")
+
+@lru_cache(maxsize=None)
+def _dark_palette() -> QPalette:
+    """
+    Build the dark theme palette, once per process
+    
+    Built on first use rather than at import, since Qt paint objects should
+    not be created before the QApplication.
+    
+    Returns:
+        QPalette: Dark theme palette
+    """
+    dark_palette = QPalette()
+    dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
+    dark_palette.setColor(QPalette.WindowText, QColor(208, 208, 208))
+    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    dark_palette.setColor(QPalette.AlternateBase, QColor(45, 45, 45))
+    dark_palette.setColor(QPalette.Text, QColor(208, 208, 208))
+    dark_palette.setColor(QPalette.Button, QColor(45, 45, 45))
+    dark_palette.setColor(QPalette.ButtonText, QColor(208, 208, 208))
+    dark_palette.setColor(QPalette.BrightText, Qt.red)
+    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.HighlightedText, Qt.black)
+    return dark_palette
+
 class MainWindow(QMainWindow):
     """
     Main window for the DavinciMCP application
     """
+    
+    # Seconds a project info read is reused by status bar updates
+    _PROJECT_INFO_TTL = 1.0
+    
+    # Startup results, emitted from background threads and delivered to the
+    # GUI thread by the default (queued across threads) connection
+    resolve_connected = Signal(bool)
+    gemini_ready = Signal(object)
+    
     def __init__(
         self, 
         controller: Optional[ResolveController] = None, 
@@ -43,6 +102,9 @@ class MainWindow(QMainWindow):
         self.gemini_handler = gemini_handler
         self.config = config or Config()
         
+        # (monotonic time, info) of the last project info read from Resolve
+        self._project_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         # Set window properties
         self.setWindowTitle("DavinciMCP - AI-Assisted Video Editing")
         self.setMinimumSize(1200, 800)
@@ -50,66 +112,63 @@ class MainWindow(QMainWindow):
         # Set dark theme
         self._set_dark_theme()
         
-        # Create UI components
+        # Create UI components; docks first, as the View menu holds their actions
+        self._create_actions()
+        self._create_central_widget()
+        self._create_dock_widgets()
         self._create_menu_bar()
         self._create_toolbar()
         self._create_status_bar()
-        self._create_central_widget()
-        self._create_dock_widgets()
         
         # Show connection status
         self._update_status_bar()
+        
+        # Wire up results of the background startup work
+        self.resolve_connected.connect(self._on_resolve_connected)
+        self.gemini_ready.connect(self.set_gemini_handler)
     
     def _set_dark_theme(self):
         """Apply dark theme to the application"""
-        dark_palette = QPalette()
-        dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.WindowText, QColor(208, 208, 208))
-        dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.Text, QColor(208, 208, 208))
-        dark_palette.setColor(QPalette.Button, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.ButtonText, QColor(208, 208, 208))
-        dark_palette.setColor(QPalette.BrightText, Qt.red)
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-        self.setPalette(dark_palette)
+        self.setPalette(_dark_palette())
+    
+    def _create_actions(self):
+        """Create the menu and toolbar actions from _ACTION_SPEC"""
+        for attr, text, slot_name, icon_text in _ACTION_SPEC:
+            action = QAction(text, self)
+            if icon_text:
+                action.setIconText(icon_text)
+            action.triggered.connect(getattr(self, slot_name))
+            setattr(self, attr, action)
+    
+    def _menu_actions(self, entries) -> List[QAction]:
+        """
+        Resolve menu entries to actions, with None becoming a separator
+        
+        Args:
+            entries: Action attribute names, or None for a separator
+            
+        Returns:
+            List[QAction]: Actions to add in one addActions() call
+        """
+        actions = []
+        for entry in entries:
+            if entry is None:
+                separator = QAction(self)
+                separator.setSeparator(True)
+                actions.append(separator)
+            else:
+                actions.append(getattr(self, entry))
+        return actions
     
     def _create_menu_bar(self):
-        """Create the main menu bar"""
+        """Create the main menu bar from _MENU_SPEC"""
         menu_bar = QMenuBar(self)
         self.setMenuBar(menu_bar)
         
-        # File menu
-        file_menu = QMenu("&File", self)
-        menu_bar.addMenu(file_menu)
-        
-        # File menu actions
-        file_menu.addAction("&Connect to Resolve", self._connect_to_resolve)
-        file_menu.addSeparator()
-        file_menu.addAction("E&xit", self.close)
-        
-        # Edit menu
-        edit_menu = QMenu("&Edit", self)
-        menu_bar.addMenu(edit_menu)
-        
-        # Tools menu
-        tools_menu = QMenu("&Tools", self)
-        menu_bar.addMenu(tools_menu)
-        
-        # AI menu
-        ai_menu = QMenu("&AI", self)
-        menu_bar.addMenu(ai_menu)
-        
-        ai_menu.addAction("&Configure Gemini API", self._configure_gemini)
-        ai_menu.addAction("&Test AI Connection", self._test_ai_connection)
-        
-        # Help menu
-        help_menu = QMenu("&Help", self)
-        menu_bar.addMenu(help_menu)
-        
-        help_menu.addAction("&About", self._show_about_dialog)
+        for title, entries in _MENU_SPEC:
+            menu = menu_bar.addMenu(title)
+            if entries:
+                menu.addActions(self._menu_actions(entries))
     
     def _create_toolbar(self):
         """Create the main toolbar"""
@@ -119,13 +178,7 @@ class MainWindow(QMainWindow):
         self.addToolBar(main_toolbar)
         
         # Add toolbar actions
-        connect_action = QAction("Connect", self)
-        connect_action.triggered.connect(self._connect_to_resolve)
-        main_toolbar.addAction(connect_action)
-        
-        analyze_action = QAction("Analyze Current", self)
-        analyze_action.triggered.connect(self._analyze_current_clip)
-        main_toolbar.addAction(analyze_action)
+        main_toolbar.addActions(self._menu_actions(_TOOLBAR_SPEC))
     
     def _create_status_bar(self):
         """Create the status bar"""
@@ -161,21 +214,42 @@ class MainWindow(QMainWindow):
             self.gemini_handler,
             self
         )
+        self.command_panel.command_executed.connect(
+            self._on_command_executed, Qt.QueuedConnection
+        )
         command_dock.setWidget(self.command_panel)
         self.addDockWidget(Qt.BottomDockWidgetArea, command_dock)
         
-        # Media browser dock
-        media_dock = QDockWidget("Media Browser", self)
-        media_dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable)
+        # Media browser dock, hidden until opened from the View menu; the
+        # browser (and its media pool scan) is built when first shown
+        self.media_dock = QDockWidget("Media Browser", self)
+        self.media_dock.setFeatures(
+            QDockWidget.DockWidgetClosable | QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable
+        )
+        self.media_browser = None
+        self.media_dock.setWidget(QWidget(self.media_dock))
+        self.media_dock.visibilityChanged.connect(self._on_media_dock_visibility)
+        self.addDockWidget(Qt.LeftDockWidgetArea, self.media_dock)
+        self.media_dock.hide()
+        self.media_dock_action = self.media_dock.toggleViewAction()
+    
+    @Slot(bool)
+    def _on_media_dock_visibility(self, visible: bool):
+        """Build the media browser the first time its dock is shown"""
+        if not visible or self.media_browser is not None:
+            return
+        
+        self.media_dock.visibilityChanged.disconnect(self._on_media_dock_visibility)
+        placeholder = self.media_dock.widget()
         self.media_browser = MediaBrowser(self.controller, self)
-        media_dock.setWidget(self.media_browser)
-        self.addDockWidget(Qt.LeftDockWidgetArea, media_dock)
+        self.media_dock.setWidget(self.media_browser)
+        placeholder.deleteLater()
     
     def _update_status_bar(self):
         """Update the status bar with current connection status"""
         if self.controller and self.controller.connected:
             self.resolve_status_label.setText("Resolve: Connected")
-            project_info = self.controller.get_project_info()
+            project_info = self._get_project_info()
             if project_info:
                 project_name = project_info.get('name', 'Unknown')
                 self.resolve_status_label.setText(f"Resolve: Connected - {project_name}")
@@ -187,13 +261,74 @@ class MainWindow(QMainWindow):
         else:
             self.ai_status_label.setText("AI: Not Connected")
     
+    @Slot(bool)
+    def _on_resolve_connected(self, connected: bool):
+        """
+        Refresh the views that were built before Resolve was connected
+        
+        Also re-enables the Connect action, disabled while the startup
+        connect runs so the controller is never connected twice at once.
+        
+        Args:
+            connected: Whether the connection succeeded
+        """
+        self.connect_action.setEnabled(True)
+        self._project_info_cache = None
+        self.command_panel.clear_interpretation_cache()
+        if connected:
+            self.timeline_view.refresh_timeline()
+            if self.media_browser is not None:
+                self.media_browser.refresh_media()
+        self._update_status_bar()
+    
+    @Slot(object)
+    def set_gemini_handler(self, gemini_handler: Optional[GeminiAPIHandler]):
+        """
+        Set the Gemini handler once it has been initialized
+        
+        Args:
+            gemini_handler: Gemini API handler, or None if AI is unavailable
+        """
+        self.gemini_handler = gemini_handler
+        self.command_panel.gemini_handler = gemini_handler
+        self.command_panel.clear_interpretation_cache()
+        self._update_status_bar()
+    
+    def _get_project_info(self) -> Dict[str, Any]:
+        """
+        Get the controller's project info, reusing it for _PROJECT_INFO_TTL
+        
+        Status updates can come from several places in quick succession, and
+        each read is a call into Resolve.
+        
+        Returns:
+            Dict[str, Any]: Project information
+        """
+        now = time.monotonic()
+        cached = self._project_info_cache
+        if cached is not None and now - cached[0] < self._PROJECT_INFO_TTL:
+            return cached[1]
+        
+        project_info = self.controller.get_project_info()
+        self._project_info_cache = (now, project_info)
+        return project_info
+    
+    @Slot(str, bool)
+    def _on_command_executed(self, command_text: str, success: bool):
+        """Show the outcome of a command panel command in the status bar"""
+        status = "Executed" if success else "Failed"
+        self.statusBar().showMessage(f"{status}: {command_text}", 5000)
+    
     # Action methods
+    @Slot()
     def _connect_to_resolve(self):
         """Attempt to connect to DaVinci Resolve"""
         if not self.controller:
             self.controller = ResolveController()
         
         connected = self.controller.connect()
+        self._project_info_cache = None
+        self.command_panel.clear_interpretation_cache()
         self._update_status_bar()
         
         if connected:
@@ -209,6 +344,7 @@ class MainWindow(QMainWindow):
                 "Failed to connect to DaVinci Resolve. Is it running?"
             )
     
+    @Slot()
     def _configure_gemini(self):
         """Configure Gemini API settings"""
         # TODO: Implement configuration dialog
@@ -218,6 +354,7 @@ class MainWindow(QMainWindow):
             "Gemini API configuration dialog will be implemented here."
         )
     
+    @Slot()
     def _test_ai_connection(self):
         """Test the connection to Gemini AI"""
         if not self.gemini_handler:
@@ -249,6 +386,7 @@ class MainWindow(QMainWindow):
                 "Gemini AI is not initialized. Please check your API key."
             )
     
+    @Slot()
     def _analyze_current_clip(self):
         """Analyze the current clip"""
         QMessageBox.information(
@@ -257,6 +395,7 @@ class MainWindow(QMainWindow):
             "Clip analysis feature will be implemented here."
         )
     
+    @Slot()
     def _show_about_dialog(self):
         """Show the about dialog"""
         QMessageBox.about(
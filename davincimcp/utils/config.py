@@ -14,11 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Logger for this module; handlers are configured by the application
 logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file if it exists
@@ -71,6 +67,7 @@ class Config:
             "gemini_temperature": float(os.getenv("GEMINI_TEMPERATURE", "0.7")),
             "gemini_max_tokens": int(os.getenv("GEMINI_MAX_TOKENS", "1024")),
             "feedback_enabled": os.getenv("FEEDBACK_ENABLED", "True").lower() in ("true", "1", "yes"),
+            "history_max": int(os.getenv("HISTORY_MAX", "1024")),
             
             # MCP configuration
             "mcp_enabled": os.getenv("MCP_ENABLED", "True").lower() in ("true", "1", "yes"),
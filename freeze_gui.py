@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+freeze_gui.py - cx_Freeze build script for a standalone DavinciMCP GUI
+
+Builds the GUI with optimized bytecode (optimize=2 strips docstrings and
+asserts) and with only the Qt modules the UI uses, so the frozen app starts
+without parsing sources or loading unused Qt plugins.
+
+Usage:
+    pip install cx_Freeze
+    python freeze_gui.py build_exe
+"""
+
+import sys
+
+from cx_Freeze import setup, Executable
+
+build_exe_options = {
+    "optimize": 2,
+    "packages": ["davincimcp"],
+    "includes": [
+        "PySide6.QtCore",
+        "PySide6.QtGui",
+        "PySide6.QtWidgets",
+    ],
+    "excludes": [
+        "tkinter",
+        "PySide6.QtWebEngineCore",
+        "PySide6.QtWebEngineWidgets",
+        "PySide6.QtMultimedia",
+        "PySide6.QtQml",
+        "PySide6.QtQuick",
+    ],
+}
+
+setup(
+    name="DavinciMCP",
+    version="0.1.0",
+    description="DavinciMCP GUI",
+    options={"build_exe": build_exe_options},
+    executables=[
+        Executable(
+            "davincimcp/ui/app.py",
+            base="gui" if sys.platform == "win32" else None,
+            target_name="davincimcp-gui",
+        )
+    ],
+)
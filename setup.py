@@ -54,6 +54,7 @@ setup(
         'dev': dev_requirements,
         'docs': ['sphinx>=7.0.0', 'sphinx-rtd-theme>=1.3.0'],
         'test': ['pytest>=7.0.0', 'pytest-mock>=3.10.0', 'pytest-cov>=4.1.0'],
+        'speedups': ['pyahocorasick>=2.0.0'],
     },
     entry_points={
         "console_scripts": [
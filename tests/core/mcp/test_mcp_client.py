@@ -94,6 +94,30 @@ class TestMCPClient:
         with patch("builtins.open", MagicMock(side_effect=Exception())):
             assert client._get_script_type("script.txt") is None
     
+    def test_get_script_type_shebang(self, tmp_path):
+        """Test script type detection from a shebang line"""
+        config = MagicMock(spec=Config)
+        config.get.return_value = False  # Disable MCP to avoid import errors
+        
+        client = MCPClient(config)
+        
+        python_script = tmp_path / "server"
+        python_script.write_bytes(b"#!/usr/bin/env python3\nprint('node')\n")
+        assert client._get_script_type(str(python_script)) == "python"
+        
+        node_script = tmp_path / "server-node"
+        node_script.write_bytes(b"#!/usr/bin/env node\n")
+        assert client._get_script_type(str(node_script)) == "node"
+        
+        plain_file = tmp_path / "notes"
+        plain_file.write_bytes(b"python and node\n")
+        assert client._get_script_type(str(plain_file)) is None
+
+        # A long interpreter path classifies the same as in MCPHandler
+        long_script = tmp_path / "server-long"
+        long_script.write_bytes(b"#!/" + b"x" * 150 + b"/python3\n")
+        assert client._get_script_type(str(long_script)) == "python"
+
     @pytest.mark.asyncio
     async def test_connect_to_server(self):
         """Test connecting to an MCP server"""
@@ -177,6 +201,22 @@ class TestMCPClient:
         assert result is False
         assert client.initialized is False
     
+    @pytest.mark.asyncio
+    async def test_connect_to_server_unsupported_script(self):
+        """Test an unsupported script is rejected before any resources are allocated"""
+        config = MagicMock(spec=Config)
+        config.get.return_value = False  # Disable MCP to avoid import errors
+        
+        client = MCPClient(config)
+        client.enabled = True
+        client.anthropic = MagicMock()
+        
+        with patch.object(MCPClient, "_get_script_type", return_value=None):
+            result = await client.connect_to_server("/path/to/server.txt")
+        
+        assert result is False
+        assert client.exit_stack is None
+    
     @pytest.mark.asyncio
     async def test_disconnect(self):
         """Test disconnecting from an MCP server"""
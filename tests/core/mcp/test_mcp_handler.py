@@ -84,27 +84,25 @@ class TestMCPHandler:
             result = handler._get_script_type(mock_path.return_value)
             assert result == "node"
     
-    def test_get_script_type_shebang(self):
+    def test_get_script_type_shebang(self, tmp_path):
         """Test script type detection using shebang"""
         config = MagicMock(spec=Config)
         handler = MCPHandler(config)
         
-        # Use a path for mocking
-        mock_path = Path("test_script.ext")
-        
-        # Mock the open function to return a file-like object with shebang
-        python_shebang = "#!/usr/bin/env python3\n"
-        node_shebang = "#!/usr/bin/env node\n"
+        script = tmp_path / "test_script.ext"
         
         # Test Python shebang
-        with patch("builtins.open", MagicMock(return_value=MagicMock(__enter__=lambda x: MagicMock(readline=lambda: python_shebang)))):
-            result = handler._get_script_type(mock_path)
-            assert result == "python"
+        script.write_bytes(b"#!/usr/bin/env python3\n")
+        assert handler._get_script_type(script) == "python"
         
-        # Test Node.js shebang
-        with patch("builtins.open", MagicMock(return_value=MagicMock(__enter__=lambda x: MagicMock(readline=lambda: node_shebang)))):
-            result = handler._get_script_type(mock_path)
-            assert result == "node"
+        # Test Node.js shebang, ignoring words after the first line
+        script.write_bytes(b"#!/usr/bin/env node\n// python\n")
+        assert handler._get_script_type(script) == "node"
+        
+        # No shebang, or no file at all
+        script.write_bytes(b"import os\n")
+        assert handler._get_script_type(script) is None
+        assert handler._get_script_type(tmp_path / "missing") is None
     
     def test_get_script_type_unknown(self):
         """Test script type detection for unknown file types"""
@@ -151,6 +149,54 @@ class TestMCPHandler:
             assert handler.server_process is mock_process
             mock_create_process.assert_called_once()
     
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux-only pipe sizing")
+    async def test_start_server_enlarges_pipes(self, tmp_path):
+        """Test the server's stdio pipes get enlarged kernel buffers"""
+        import fcntl
+        from davincimcp.core.mcp.mcp_handler import _pipe_size
+        
+        script = tmp_path / "server.py"
+        script.write_text("import sys\nsys.stdin.read()\n")
+        config = MagicMock(spec=Config)
+        config.get.side_effect = lambda key, default=None: {
+            "mcp_enabled": True,
+            "mcp_server_script": str(script),
+        }.get(key, default)
+        
+        handler = MCPHandler(config)
+        assert await handler.start_server() is True
+        try:
+            pipe = handler.server_process.stdin.transport.get_extra_info("pipe")
+            assert fcntl.fcntl(pipe.fileno(), fcntl.F_GETPIPE_SZ) == _pipe_size()
+        finally:
+            await handler.stop_server()
+    
+    @pytest.mark.asyncio
+    async def test_start_server_stderr_debug(self, tmp_path, caplog):
+        """Test the server's stderr is only captured and logged at debug level"""
+        script = tmp_path / "server.py"
+        script.write_text("import sys\nsys.stderr.write('ready\\n')\nsys.stdin.read()\n")
+        config = MagicMock(spec=Config)
+        config.get.side_effect = lambda key, default=None: {
+            "mcp_enabled": True,
+            "mcp_server_script": str(script),
+        }.get(key, default)
+        
+        handler = MCPHandler(config)
+        with caplog.at_level("INFO", logger="davincimcp.core.mcp.mcp_handler"):
+            assert await handler.start_server() is True
+        assert handler.server_process.stderr is None
+        await handler.stop_server()
+        
+        with caplog.at_level("DEBUG", logger="davincimcp.core.mcp.mcp_handler"):
+            assert await handler.start_server() is True
+            task = handler._stderr_task
+            handler.server_process.stdin.close()
+            await asyncio.wait_for(task, timeout=5.0)
+            await handler.stop_server()
+        assert "MCP server: ready" in caplog.text
+    
     @pytest.mark.asyncio
     async def test_start_server_disabled(self):
         """Test starting the server when MCP is disabled"""
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the media control handler module
+"""
+
+import sys
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from davincimcp.core.media.media_control_handler import MediaControlHandler
+
+
+class TestMediaControlHandler:
+    """Tests for the MediaControlHandler class"""
+    
+    @pytest.fixture
+    def handler(self):
+        """Create a media control handler with a mock controller"""
+        return MediaControlHandler(MagicMock())
+    
+    def test_supported_commands(self, handler):
+        """Test every supported command dispatches to a handler method"""
+        assert "PlaybackStart" in handler.supported_commands
+        for command, func in MediaControlHandler._DISPATCH.items():
+            assert getattr(handler, func.__name__).__func__ is func, command
+    
+    def test_execute_command(self, handler):
+        """Test executing a supported command adds a success status"""
+        result = handler.execute_command("JumpToTimecode", {"timecode": "01:00:00:00"})
+        
+        assert result == {"message": "Jumped to timecode: 01:00:00:00", "status": "success"}
+    
+    def test_execute_command_fixed_result(self, handler):
+        """Test a parameterless command returns a fresh success result"""
+        result = handler.execute_command("PlaybackStart")
+        
+        assert result == {"message": "Playback started", "status": "success"}
+        assert handler.execute_command("PlaybackStart") is not result
+    
+    def test_execute_command_missing_param(self, handler):
+        """Test a missing required parameter returns an error"""
+        result = handler.execute_command("SetPlaybackSpeed")
+        
+        assert result["status"] == "error"
+        assert "speed" in result["message"]
+        
+        # Each call gets its own plain dict that callers may extend
+        result["feedback"] = "Try adding a speed"
+        assert "feedback" not in handler.execute_command("SetPlaybackSpeed")
+    
+    def test_execute_unsupported_command(self, handler):
+        """Test an unsupported command returns an error"""
+        result = handler.execute_command("Rewind")
+        
+        assert result["status"] == "error"
+        assert "Unsupported" in result["message"]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the Resolve controller module
+"""
+
+import sys
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from davincimcp.core.resolve_controller import ResolveController
+
+
+class TestResolveController:
+    """Tests for the ResolveController class"""
+    
+    @pytest.fixture
+    def controller(self):
+        """Create a controller connected to a mock Resolve"""
+        controller = ResolveController()
+        controller._bmd = MagicMock()
+        assert controller.connect() is True
+        return controller
+    
+    def test_get_project_info(self, controller):
+        """Test project info reads the name once per project"""
+        project = controller.current_project
+        project.GetName.return_value = "Test Project"
+        project.GetTimelineCount.side_effect = [1, 2]
+        project.GetName.reset_mock()
+        
+        assert controller.get_project_info() == {"name": "Test Project", "timeline_count": 1}
+        assert controller.get_project_info() == {"name": "Test Project", "timeline_count": 2}
+        project.GetName.assert_called_once()
+    
+    def test_get_project_info_new_project(self, controller):
+        """Test the cached name is dropped when the project changes"""
+        controller.current_project.GetName.return_value = "First"
+        assert controller.get_project_info()["name"] == "First"
+        
+        controller.current_project = MagicMock()
+        controller.current_project.GetName.return_value = "Second"
+        assert controller.get_project_info()["name"] == "Second"
+    
+    def test_get_project_info_not_connected(self):
+        """Test project info is empty without a connection"""
+        assert ResolveController().get_project_info() == {}
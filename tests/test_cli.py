@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Tests for the command line interface.
+"""
+
+import asyncio
+import io
+import logging
+import os
+import signal
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from davincimcp.cli import main, parse_args, run_server_mode
+from davincimcp.utils.config import Config
+from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor
+from davincimcp.interactive.prompt import read_commands, run_interactive_session, _setup_readline, HISTORY_LENGTH
+
+class TestParseArgs:
+    """Tests for command line argument parsing"""
+    
+    def test_no_command(self):
+        """Test parsing with no subcommand"""
+        args = parse_args([])
+        assert args.command is None
+        assert args.log_level is None
+        assert args.no_feedback is False
+        assert args.use_mcp is False
+    
+    def test_subcommand_defaults(self):
+        """Test options of other subcommands default on every subcommand"""
+        args = parse_args(["cmd", "cut"])
+        assert args.use_mcp is False
+        assert args.server_script is None
+        
+        args = parse_args(["mcp", "--server-script", "server.py"])
+        assert args.server_script == "server.py"
+        assert args.no_feedback is False
+    
+    def test_log_level(self):
+        """Test --log-level is converted to a numeric level"""
+        args = parse_args(["--log-level", "DEBUG", "gui"])
+        assert args.log_level == logging.DEBUG
+    
+    def test_invalid_log_level(self, capsys):
+        """Test an unknown --log-level is rejected"""
+        with pytest.raises(SystemExit):
+            parse_args(["--log-level", "VERBOSE"])
+        assert "invalid choice" in capsys.readouterr().err
+    
+    def test_cmd_arguments(self):
+        """Test single command mode arguments"""
+        args = parse_args(["cmd", "cut here", "--no-feedback"])
+        assert args.command == "cmd"
+        assert args.text == "cut here"
+        assert args.no_feedback is True
+    
+    def test_analyze_arguments(self):
+        """Test analyze mode arguments and defaults"""
+        args = parse_args(["analyze", "--target", "all"])
+        assert args.target == "all"
+        assert args.output == "console"
+        assert args.output_file is None
+    
+    def test_repeated_parsing(self):
+        """Test the cached parser handles repeated calls"""
+        first = parse_args(["mcp", "--server-script", "server.py"])
+        second = parse_args(["mcp"])
+        assert first.server_script == "server.py"
+        assert second.server_script is None
+    
+    def test_subcommand_help(self, capsys):
+        """Test subcommand help includes lazily added arguments"""
+        with pytest.raises(SystemExit):
+            parse_args(["analyze", "--help"])
+        assert "--output-file" in capsys.readouterr().out
+
+class TestMain:
+    """Tests for subcommand dispatch"""
+    
+    def test_gui_fast_path(self):
+        """Test a bare gui subcommand skips argument parsing"""
+        with patch('davincimcp.cli.run_gui_mode', return_value=0) as run_gui, \
+             patch('davincimcp.cli.parse_args') as parse, \
+             patch('davincimcp.cli.logging.basicConfig') as basic_config:
+            assert main(["gui"]) == 0
+        
+        run_gui.assert_called_once_with()
+        parse.assert_not_called()
+        basic_config.assert_called_once()
+    
+    def test_cmd_dispatch(self, capsys):
+        """Test the cmd subcommand runs the command through the executor"""
+        with patch('davincimcp.core.resolve_controller.ResolveController') as controller_cls:
+            controller_cls.return_value.add_marker.return_value = True
+            assert main(["cmd", "add marker"]) == 0
+        
+        assert capsys.readouterr().out.startswith("success")
+    
+    def test_controller_connection_failure(self):
+        """Test subcommands needing Resolve fail when it is not running"""
+        with patch('davincimcp.core.resolve_controller.ResolveController') as controller_cls:
+            controller_cls.return_value.connect.return_value = False
+            assert main(["cmd", "cut"]) == 1
+            assert main(["analyze"]) == 1
+
+    def test_analyze_to_console(self, capsys):
+        """Test analyze prints the report to the console"""
+        with patch('davincimcp.core.resolve_controller.ResolveController'), \
+             patch('davincimcp.media.analyzer.MediaAnalyzer') as analyzer_cls, \
+             patch('davincimcp.media.analyzer.EditSuggestionEngine') as engine_cls:
+            analyzer_cls.return_value.analyze_all_media.return_value = {"shots": 3}
+            engine_cls.return_value.generate_suggestions.return_value = ["cut"]
+            assert main(["analyze", "--target", "all"]) == 0
+        
+        assert capsys.readouterr().out == (
+            "Analysis results for all media:\n"
+            "{'shots': 3}\n"
+            "\nEdit suggestions:\n"
+            "['cut']\n"
+        )
+    
+    def test_analyze_to_file(self, tmp_path):
+        """Test analyze writes the report to the output file"""
+        output_file = tmp_path / "report.txt"
+        with patch('davincimcp.core.resolve_controller.ResolveController'), \
+             patch('davincimcp.media.analyzer.MediaAnalyzer') as analyzer_cls, \
+             patch('davincimcp.media.analyzer.EditSuggestionEngine') as engine_cls:
+            analyzer_cls.return_value.analyze_current_clip.return_value = {"shots": 3}
+            engine_cls.return_value.generate_suggestions.return_value = ["cut"]
+            assert main(["analyze", "--output", "file", "--output-file", str(output_file)]) == 0
+        
+        assert output_file.read_text() == (
+            "Analysis results for current media:\n"
+            "{'shots': 3}\n\n"
+            "Edit suggestions:\n"
+            "['cut']\n"
+        )
+
+class TestRunServerMode:
+    """Tests for MCP server mode"""
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs loop signal handlers")
+    def test_stops_on_sigterm(self):
+        """Test the server waits until SIGTERM and then stops cleanly"""
+        async def run():
+            asyncio.get_running_loop().call_later(0.05, os.kill, os.getpid(), signal.SIGTERM)
+            return await run_server_mode(Config())
+        
+        with patch('davincimcp.core.mcp.mcp_handler.MCPHandler') as handler_cls:
+            handler = handler_cls.return_value
+            handler.start_server = AsyncMock(return_value=True)
+            handler.stop_server = AsyncMock()
+            assert asyncio.run(run()) == 0
+        
+        handler.stop_server.assert_awaited_once()
+
+class TestReadCommands:
+    """Tests for reading prompt input"""
+    
+    def test_piped_input(self, monkeypatch, capsys):
+        """Test piped input is read line by line without prompts"""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("cut\n\n  add a fade \nexit\n"))
+        
+        assert list(read_commands("> ")) == ["cut", "add a fade", "exit"]
+        assert capsys.readouterr().out == ""
+
+class TestSetupReadline:
+    """Tests for prompt readline setup"""
+    
+    @pytest.fixture
+    def executor(self):
+        """Create a command executor over a mock controller"""
+        return CommandExecutor(CommandRegistry(MagicMock()))
+    
+    def test_piped_input_skips_readline(self, monkeypatch, executor):
+        """Test piped input neither loads nor configures readline history"""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("exit\n"))
+        with patch('davincimcp.interactive.prompt.readline') as mock_readline:
+            assert _setup_readline(executor) is False
+        
+        mock_readline.read_history_file.assert_not_called()
+    
+    def test_terminal_bounds_history(self, monkeypatch, executor):
+        """Test a terminal session caps the history before loading it"""
+        monkeypatch.setattr(sys, "stdin", MagicMock(isatty=lambda: True))
+        with patch('davincimcp.interactive.prompt.readline') as mock_readline:
+            assert _setup_readline(executor) is True
+        
+        mock_readline.set_history_length.assert_called_once_with(HISTORY_LENGTH)
+        mock_readline.read_history_file.assert_called_once()
+
+class TestInteractiveSession:
+    """Tests for the interactive prompt loop"""
+    
+    @pytest.fixture
+    def executor(self):
+        """Create a command executor over a mock controller"""
+        return CommandExecutor(CommandRegistry(MagicMock()))
+    
+    def run_session(self, monkeypatch, executor, gemini_handler, script):
+        """Run a session over piped input"""
+        monkeypatch.setattr(sys, "stdin", io.StringIO(script))
+        with patch('davincimcp.interactive.prompt.readline', None):
+            return run_interactive_session(executor, gemini_handler, MagicMock(), MagicMock())
+    
+    def test_ai_interpretation_executed(self, monkeypatch, capsys, executor):
+        """Test the AI's interpretation is executed when it is a known command"""
+        gemini_handler = MagicMock(initialized=True)
+        gemini_handler.generate_response_stream.return_value = iter(["add a ", "marker\nThis adds", " a marker"])
+        
+        assert self.run_session(monkeypatch, executor, gemini_handler, "drop a flag here\nexit\n") == 0
+        
+        assert executor.history[-1].command_id == "marker"
+        assert "Executing command: add a marker" in capsys.readouterr().out
+    
+    def test_ai_failure_falls_back_to_text(self, monkeypatch, executor):
+        """Test the typed command is executed when the AI reply is not a command"""
+        gemini_handler = MagicMock(initialized=True)
+        gemini_handler.generate_response_stream.return_value = iter(["Error: API not initialized"])
+        
+        self.run_session(monkeypatch, executor, gemini_handler, "make it pop\n")
+        
+        gemini_handler.generate_response_stream.assert_called_once()
+        assert executor.history[-1].result["status"] == "no_match"
+        assert executor.history[-1].original_text == "make it pop"
+    
+    def test_ai_error_reply_not_matched(self, monkeypatch, executor):
+        """Test an error reply is not phrase-matched as a command"""
+        gemini_handler = MagicMock(initialized=True)
+        gemini_handler.generate_response_stream.return_value = iter(
+            ["Error: Failed to execute request: deadline exceeded"]
+        )
+        
+        self.run_session(monkeypatch, executor, gemini_handler, "make it pop\n")
+        
+        assert executor.history[-1].command_id is None
+        assert executor.history[-1].original_text == "make it pop"
+    
+    def test_known_command_skips_ai(self, monkeypatch, executor):
+        """Test a command matching a known phrase is executed without the AI"""
+        gemini_handler = MagicMock(initialized=True)
+        
+        self.run_session(monkeypatch, executor, gemini_handler, "add a fade\n")
+        
+        gemini_handler.generate_response_stream.assert_not_called()
+        assert executor.history[-1].command_id == "transition"
+        assert executor.history[-1].original_text == "add a fade"
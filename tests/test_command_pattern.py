@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from davincimcp.commands.command_base import Command
-from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor
+from davincimcp.commands.command_registry import CommandRegistry, CommandExecutor, _HistEntry, _PhraseTrie
 from davincimcp.commands.editing_commands import CutCommand, AddTransitionCommand, SetMarkerCommand
 
 class MockCommand(Command):
@@ -59,6 +59,15 @@ class TestCommandBase:
         assert cmd.get_description() == "Test command description"
         assert cmd.get_feedback(result) == "Test command succeeded"
     
+    def test_default_feedback(self):
+        """Test the default feedback formats the result and skips empty results"""
+        class PlainCommand(Command):
+            pass
+        
+        cmd = PlainCommand()
+        assert cmd.get_feedback({"status": "success"}) == "Command executed with result: {'status': 'success'}"
+        assert cmd.get_feedback({}) == ""
+    
     def test_cut_command_initialization(self):
         """Test CutCommand initialization"""
         mock_controller = MagicMock()
@@ -142,6 +151,10 @@ class TestCommandRegistry:
         assert result["command_id"] == "transition"
         assert result["params"].get("type") == "Fade"
         assert result["params"].get("duration") == 2.5
+        
+        result = registry.match_nlp_intent("add a push transition")
+        assert result["command_id"] == "transition"
+        assert result["params"].get("type") == "Push"
     
     def test_match_nlp_intent_marker(self, registry):
         """Test matching NLP intent for marker command"""
@@ -155,6 +168,80 @@ class TestCommandRegistry:
         assert result["command_id"] == "marker"
         assert result["params"].get("color") == "Red"
     
+    def test_match_nlp_intent_marker_color_whole_word(self, registry):
+        """Test marker colors only match whole words"""
+        result = registry.match_nlp_intent("set marker for the ordered list")
+        assert "color" not in result["params"]
+        
+        result = registry.match_nlp_intent("create marker, make it green not blue")
+        assert result["params"]["color"] == "Green"
+    
+    def test_match_nlp_intent_longest_phrase(self, registry):
+        """Test that the longest matching phrase selects the command"""
+        result = registry.match_nlp_intent("add a marker at the cut")
+        assert result is not None
+        assert result["command_id"] == "marker"
+    
+    def test_match_nlp_intent_without_automaton(self, mock_controller):
+        """Test matching falls back to the phrase trie without pyahocorasick"""
+        with patch('davincimcp.commands.command_registry.ahocorasick', None):
+            registry = CommandRegistry(mock_controller)
+        
+        assert isinstance(registry._matcher, _PhraseTrie)
+        result = registry.match_nlp_intent("add a marker at the cut")
+        assert result is not None
+        assert result["command_id"] == "marker"
+        
+        result = registry.match_nlp_intent("add a 2s cross dissolve")
+        assert result["command_id"] == "transition"
+        assert result["params"] == {"type": "Cross Dissolve", "duration": 2.0}
+    
+    def test_match_nlp_intent_exact_input(self, registry):
+        """Test whole-input command IDs and phrases skip the phrase scan"""
+        assert registry.match_nlp_intent(" Marker ") == {"command_id": "marker", "params": {}}
+        
+        result = registry.match_nlp_intent("cross dissolve")
+        assert result == {"command_id": "transition", "params": {"type": "Cross Dissolve"}}
+        assert registry._match_cached.cache_info().misses == 0
+    
+    def test_match_nlp_intent_cached(self, registry):
+        """Test repeated inputs reuse the cached match without sharing params"""
+        first = registry.match_nlp_intent("add a 2s fade")
+        first["params"]["type"] = "Wipe"
+        second = registry.match_nlp_intent("  Add a 2s fade ")
+        
+        assert second["params"] == {"type": "Fade", "duration": 2.0}
+        assert registry._match_cached.cache_info().hits == 1
+    
+    def test_match_nlp_intent_batch(self, registry):
+        """Test batch matching agrees with single matching and skips the caches"""
+        texts = ["Add a 2s fade", "marker", "nothing to see here", "cut the clip named intro"]
+        
+        results = registry.match_nlp_intent_batch(texts)
+        
+        assert results == [registry.match_nlp_intent(text) for text in texts]
+        assert results[2] is None
+        assert registry._match_cached.cache_info().hits == 0
+    
+    def test_matcher_shared_across_registries(self, registry):
+        """Test registries with identical phrase tables reuse the built matcher"""
+        other = CommandRegistry(MagicMock())
+        
+        assert other._matcher is registry._matcher
+        assert other.commands["cut"].resolve_controller is not registry.resolve_controller
+        assert other.match_nlp_intent("add a fade") == registry.match_nlp_intent("add a fade")
+    
+    def test_phrase_trie_shared_prefixes(self):
+        """Test the phrase trie prefers the longest of prefix-sharing phrases"""
+        trie = _PhraseTrie()
+        trie.insert("cut", "cut")
+        trie.insert("cut clip", "cut_clip")
+        trie.insert("cross dissolve", "transition")
+        
+        assert list(trie.iter("please cut clip now")) == [(9, "cut"), (14, "cut_clip")]
+        assert list(trie.iter("add a cross dissolve")) == [(19, "transition")]
+        assert list(trie.iter("cross fade")) == []
+    
     def test_no_match_nlp_intent(self, registry):
         """Test no match for NLP intent"""
         result = registry.match_nlp_intent("do something completely different")
@@ -202,7 +289,7 @@ class TestCommandExecutor:
         
         result = executor.execute_from_text("unknown command")
         
-        assert result["status"] == "error"
+        assert result["status"] == "no_match"
         assert "Could not understand command" in result["message"]
         assert len(executor.history) == 1
     
@@ -230,16 +317,61 @@ class TestCommandExecutor:
     def test_get_last_feedback_with_history(self, executor):
         """Test getting last feedback with history"""
         # Add a mock result to history
-        executor.history.append({
-            "command_id": "test",
-            "params": {},
-            "result": {"status": "success", "feedback": "Test feedback"},
-            "original_text": "test command"
-        })
+        executor.history.append(_HistEntry(
+            command_id="test",
+            params={},
+            result={"status": "success", "feedback": "Test feedback"},
+            original_text="test command"
+        ))
         
         feedback = executor.get_last_feedback()
         assert feedback == "Test feedback"
     
+    def test_get_last_feedback_stored_in_history(self, executor, mock_registry):
+        """Test feedback computed at execution is read back from history"""
+        executor.execute_command("test")
+        mock_registry.get_command.reset_mock()
+        
+        assert executor.history[-1].feedback == "Test command succeeded"
+        assert executor.get_last_feedback() == "Test command succeeded"
+        mock_registry.get_command.assert_not_called()
+    
+    def test_get_last_feedback_when_disabled(self, mock_registry):
+        """Test feedback is built on demand once when disabled at execution"""
+        executor = CommandExecutor(mock_registry, feedback_enabled=False)
+        result = executor.execute_command("test")
+        mock_registry.get_command.reset_mock()
+        
+        assert "feedback" not in result
+        assert executor.get_last_feedback() == "Test command succeeded"
+        assert executor.get_last_feedback() == "Test command succeeded"
+        mock_registry.get_command.assert_called_once_with("test")
+    
+    def test_execute_command_by_id(self, executor, mock_registry):
+        """Test executing a command by ID skips NLP matching"""
+        result = executor.execute_command("test")
+        
+        mock_registry.match_nlp_intent.assert_not_called()
+        mock_registry.get_command.assert_called_with("test")
+        assert result["status"] == "success"
+        assert executor.history[-1].original_text == "test"
+    
+    def test_history_is_bounded(self, executor):
+        """Test that history keeps only the most recent entries"""
+        for i in range(CommandExecutor.HISTORY_MAX + 5):
+            executor.execute_from_text(f"test command {i}")
+        
+        assert len(executor.history) == CommandExecutor.HISTORY_MAX
+        assert executor.history[-1].original_text == f"test command {CommandExecutor.HISTORY_MAX + 4}"
+    
+    def test_history_max(self, mock_registry):
+        """Test the history bound can be configured"""
+        executor = CommandExecutor(mock_registry, history_max=2)
+        for i in range(3):
+            executor.execute_command("test", text=f"test {i}")
+        
+        assert [entry.original_text for entry in executor.history] == ["test 1", "test 2"]
+    
     def test_get_last_feedback_no_history(self, executor):
         """Test getting last feedback with no history"""
         feedback = executor.get_last_feedback()
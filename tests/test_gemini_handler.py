@@ -87,6 +87,18 @@ class TestGeminiAPIHandler:
         assert response == "Mock response"
         mock_genai['model_instance'].generate_content.assert_called_once_with("Test prompt")
     
+    def test_generate_response_stream(self, mock_genai):
+        """Test generate_response_stream yields response chunks"""
+        mock_genai['model_instance'].generate_content.return_value = iter(
+            [MockGeminiResponse("Mock "), MockGeminiResponse("response")]
+        )
+        
+        handler = GeminiAPIHandler("test_api_key")
+        chunks = list(handler.generate_response_stream("Test prompt"))
+        
+        assert chunks == ["Mock ", "response"]
+        mock_genai['model_instance'].generate_content.assert_called_once_with("Test prompt", stream=True)
+    
     def test_generate_response_not_initialized(self):
         """Test generate_response when not initialized"""
         handler = GeminiAPIHandler()
@@ -124,6 +136,16 @@ class TestGeminiAPIHandler:
         assert kwargs["generation_config"]["temperature"] == 0.8
         assert kwargs["generation_config"]["max_output_tokens"] == 2048
     
+    def test_generate_with_config_defaults(self, mock_genai):
+        """Test generate_with_config without overrides uses the default config"""
+        handler = GeminiAPIHandler("test_api_key")
+        handler.generate_with_config("Test prompt", temperature=0.1)
+        handler.generate_with_config("Test prompt")
+        
+        args, kwargs = mock_genai['model_instance'].generate_content.call_args
+        assert kwargs["generation_config"] is handler.generation_config
+        assert handler.generation_config["temperature"] == 0.7
+    
     def test_chat_session(self, mock_genai):
         """Test chat_session method"""
         # Set up the mock chat behavior
@@ -147,4 +169,37 @@ class TestGeminiAPIHandler:
         # Should have sent two user messages
         assert mock_chat.send_message.call_count == 2
         mock_chat.send_message.assert_any_call("Hello")
-        mock_chat.send_message.assert_any_call("How are you?") 
\ No newline at end of file
+        mock_chat.send_message.assert_any_call("How are you?")
+    
+    def test_chat_session_reused(self, mock_genai):
+        """Test a chat session with an ID is created once and reused"""
+        mock_chat = MagicMock()
+        mock_chat.send_message.return_value = MockGeminiResponse("Mock chat response")
+        mock_genai['model_instance'].start_chat.return_value = mock_chat
+        
+        handler = GeminiAPIHandler("test_api_key")
+        
+        messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "model", "content": "Hi there"},
+            {"role": "user", "content": "How are you?"}
+        ]
+        assert handler.chat_session(messages, session_id="edit") == "Mock chat response"
+        
+        messages += [
+            {"role": "model", "content": "Fine"},
+            {"role": "user", "content": "Add a marker"}
+        ]
+        assert handler.chat_session(messages, session_id="edit") == "Mock chat response"
+        
+        mock_genai['model_instance'].start_chat.assert_called_once_with(history=[
+            {"role": "user", "parts": ["Hello"]},
+            {"role": "model", "parts": ["Hi there"]}
+        ])
+        assert [c.args[0] for c in mock_chat.send_message.call_args_list] == [
+            "How are you?", "Add a marker"
+        ]
+        
+        handler.end_chat_session("edit")
+        handler.chat_session(messages, session_id="edit")
+        assert mock_genai['model_instance'].start_chat.call_count == 2